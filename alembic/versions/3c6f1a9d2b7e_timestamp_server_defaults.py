@@ -0,0 +1,36 @@
+"""timestamp_server_defaults
+
+Revision ID: 3c6f1a9d2b7e
+Revises: adf27922d33d
+Create Date: 2026-10-15 09:12:41.503218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c6f1a9d2b7e"
+down_revision: Union[str, Sequence[str], None] = "adf27922d33d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Let the database generate created_at/updated_at on INSERT
+    op.alter_column("users", "created_at", server_default=sa.func.now())
+    op.alter_column("users", "updated_at", server_default=sa.func.now())
+    op.alter_column("tokens", "created_at", server_default=sa.func.now())
+    op.alter_column("tokens", "updated_at", server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column("tokens", "updated_at", server_default=None)
+    op.alter_column("tokens", "created_at", server_default=None)
+    op.alter_column("users", "updated_at", server_default=None)
+    op.alter_column("users", "created_at", server_default=None)
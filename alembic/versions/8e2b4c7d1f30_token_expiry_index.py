@@ -0,0 +1,39 @@
+"""token_expiry_index
+
+Revision ID: 8e2b4c7d1f30
+Revises: 3c6f1a9d2b7e
+Create Date: 2026-10-15 11:04:27.118305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e2b4c7d1f30"
+down_revision: Union[str, Sequence[str], None] = "3c6f1a9d2b7e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    # The concurrently flag is ignored on non-PostgreSQL backends.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tokens_expires_at",
+            "tokens",
+            ["expires_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tokens_expires_at", table_name="tokens", postgresql_concurrently=True
+        )
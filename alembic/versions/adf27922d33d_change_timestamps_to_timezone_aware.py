@@ -19,39 +19,42 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Change timestamp columns to timezone-aware (TIMESTAMP WITH TIME ZONE)
-    op.execute(
-        "ALTER TABLE users ALTER COLUMN created_at TYPE TIMESTAMP WITH TIME ZONE"
-    )
-    op.execute(
-        "ALTER TABLE users ALTER COLUMN updated_at TYPE TIMESTAMP WITH TIME ZONE"
-    )
-    op.execute(
-        "ALTER TABLE tokens ALTER COLUMN created_at TYPE TIMESTAMP WITH TIME ZONE"
-    )
+    # With the session time zone at UTC, PostgreSQL 12+ treats timestamp and
+    # timestamptz as binary-coercible and skips the table rewrite. It also makes
+    # the existing naive values be read as UTC, which is how they were written.
+    # None of these columns is indexed at this revision, so there is nothing
+    # to rebuild afterwards; ix_tokens_expires_at is created later, with
+    # CREATE INDEX CONCURRENTLY, by 8e2b4c7d1f30.
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+
+    # Change timestamp columns to timezone-aware (TIMESTAMP WITH TIME ZONE).
+    # One ALTER TABLE per table so each table is processed and locked only once.
     op.execute(
-        "ALTER TABLE tokens ALTER COLUMN updated_at TYPE TIMESTAMP WITH TIME ZONE"
+        "ALTER TABLE users "
+        "ALTER COLUMN created_at TYPE TIMESTAMP WITH TIME ZONE, "
+        "ALTER COLUMN updated_at TYPE TIMESTAMP WITH TIME ZONE"
     )
     op.execute(
-        "ALTER TABLE tokens ALTER COLUMN expires_at TYPE TIMESTAMP WITH TIME ZONE"
+        "ALTER TABLE tokens "
+        "ALTER COLUMN created_at TYPE TIMESTAMP WITH TIME ZONE, "
+        "ALTER COLUMN updated_at TYPE TIMESTAMP WITH TIME ZONE, "
+        "ALTER COLUMN expires_at TYPE TIMESTAMP WITH TIME ZONE"
     )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+
     # Revert to timezone-naive timestamps
     op.execute(
-        "ALTER TABLE users ALTER COLUMN created_at TYPE TIMESTAMP WITHOUT TIME ZONE"
-    )
-    op.execute(
-        "ALTER TABLE users ALTER COLUMN updated_at TYPE TIMESTAMP WITHOUT TIME ZONE"
-    )
-    op.execute(
-        "ALTER TABLE tokens ALTER COLUMN created_at TYPE TIMESTAMP WITHOUT TIME ZONE"
-    )
-    op.execute(
-        "ALTER TABLE tokens ALTER COLUMN updated_at TYPE TIMESTAMP WITHOUT TIME ZONE"
+        "ALTER TABLE users "
+        "ALTER COLUMN created_at TYPE TIMESTAMP WITHOUT TIME ZONE, "
+        "ALTER COLUMN updated_at TYPE TIMESTAMP WITHOUT TIME ZONE"
     )
     op.execute(
-        "ALTER TABLE tokens ALTER COLUMN expires_at TYPE TIMESTAMP WITHOUT TIME ZONE"
+        "ALTER TABLE tokens "
+        "ALTER COLUMN created_at TYPE TIMESTAMP WITHOUT TIME ZONE, "
+        "ALTER COLUMN updated_at TYPE TIMESTAMP WITHOUT TIME ZONE, "
+        "ALTER COLUMN expires_at TYPE TIMESTAMP WITHOUT TIME ZONE"
     )
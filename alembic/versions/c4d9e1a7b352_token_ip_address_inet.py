@@ -0,0 +1,49 @@
+"""token_ip_address_inet
+
+Revision ID: c4d9e1a7b352
+Revises: 8e2b4c7d1f30
+Create Date: 2026-10-15 11:26:53.640172
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d9e1a7b352"
+down_revision: Union[str, Sequence[str], None] = "8e2b4c7d1f30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Other backends keep a VARCHAR column; only PostgreSQL has INET.
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "tokens",
+        "ip_address",
+        existing_type=sa.String(length=255),
+        type_=postgresql.INET(),
+        existing_nullable=True,
+        postgresql_using="ip_address::inet",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "tokens",
+        "ip_address",
+        existing_type=postgresql.INET(),
+        type_=sa.String(length=255),
+        existing_nullable=True,
+        postgresql_using="host(ip_address)",
+    )
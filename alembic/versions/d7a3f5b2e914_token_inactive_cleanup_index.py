@@ -0,0 +1,44 @@
+"""token_inactive_cleanup_index
+
+Revision ID: d7a3f5b2e914
+Revises: c4d9e1a7b352
+Create Date: 2026-10-15 11:42:08.503117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a3f5b2e914"
+down_revision: Union[str, Sequence[str], None] = "c4d9e1a7b352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tokens_inactive_updated_at",
+            "tokens",
+            ["updated_at"],
+            unique=False,
+            postgresql_where=sa.text("NOT is_active"),
+            sqlite_where=sa.text("NOT is_active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tokens_inactive_updated_at",
+            table_name="tokens",
+            postgresql_concurrently=True,
+        )
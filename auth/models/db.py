@@ -1,28 +1,30 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy import DateTime, ForeignKey, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from auth.models.enums import UserRole
 from core.database import Base
+from core.db.ids import uuid7
+from core.db.types import IPAddress
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     email: Mapped[str] = mapped_column(unique=True, index=True)
     hashed_password: Mapped[str] = mapped_column()
     is_active: Mapped[bool] = mapped_column(default=True)
     role: Mapped[UserRole] = mapped_column(default=UserRole.VIEWER)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     # Relationships
@@ -31,26 +33,35 @@ class User(Base):
 
 class Token(Base):
     __tablename__ = "tokens"
-    __table_args__ = {"extend_existing": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     is_active: Mapped[bool] = mapped_column(default=True)
-    ip_address: Mapped[str | None] = mapped_column(String(length=255))
+    ip_address: Mapped[str | None] = mapped_column(IPAddress)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="tokens")
 
-    __table_args__ = (  # type: ignore[assignment]
+    __table_args__ = (
+        # Full index on the foreign key: deleting a user checks tokens for
+        # referencing rows, active or not
         Index("ix_tokens_user_id", "user_id"),
         Index("ix_tokens_ip_address", "ip_address"),
+        Index("ix_tokens_expires_at", "expires_at"),
+        # Drives the batched purge of revoked tokens in token_cleanup
+        Index(
+            "ix_tokens_inactive_updated_at",
+            "updated_at",
+            postgresql_where=text("NOT is_active"),
+            sqlite_where=text("NOT is_active"),
+        ),
     )
@@ -1,12 +1,13 @@
 """Domain models (DTOs) for the authentication module.
 
 These immutable data transfer objects represent domain entities at different
-lifecycle stages, ensuring type safety and clear intent.
+lifecycle stages, ensuring type safety and clear intent. They use __slots__,
+since a DTO is built for every row a repository returns.
 """
 
 import uuid
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 from auth.models.enums import UserRole
 
@@ -15,12 +16,15 @@ from auth.models.enums import UserRole
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateUserDTO:
     """DTO for creating a new user.
 
     Contains only the required fields for user creation.
     Password should already be hashed.
+
+    Raises:
+        ValueError: If email or hashed_password is empty
     """
 
     email: str
@@ -28,8 +32,14 @@ class CreateUserDTO:
     role: UserRole = UserRole.MEMBER
     is_active: bool = True
 
+    def __post_init__(self) -> None:
+        if not self.email:
+            raise ValueError("User email is required")
+        if not self.hashed_password:
+            raise ValueError("User hashed_password is required")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserDTO:
     """DTO for an existing user.
 
@@ -46,7 +56,7 @@ class UserDTO:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateUserDTO:
     """DTO for updating a user.
 
@@ -64,11 +74,15 @@ class UpdateUserDTO:
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateTokenDTO:
     """DTO for creating a new token.
 
     Contains only the required fields for token creation.
+
+    Raises:
+        ValueError: If user_id or expires_at is missing, or expires_at is
+            not in the future
     """
 
     user_id: uuid.UUID
@@ -76,8 +90,16 @@ class CreateTokenDTO:
     is_active: bool = True
     ip_address: str | None = None
 
+    def __post_init__(self) -> None:
+        if not self.user_id:
+            raise ValueError("Token user_id is required")
+        if not self.expires_at:
+            raise ValueError("Token expires_at is required")
+        if self.expires_at < datetime.now(timezone.utc):
+            raise ValueError("Token expires_at must be in the future")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenDTO:
     """DTO for an existing token.
 
@@ -94,7 +116,7 @@ class TokenDTO:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateTokenDTO:
     """DTO for updating a token.
 
@@ -1,22 +1,30 @@
 # models/enums.py (NEW FILE)
+import sys
 from enum import Enum
 
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:  # pragma: no cover
+    from typing_extensions import Self
+
 
 class UserRole(str, Enum):
-    """Simple role hierarchy for SaaS/AI apps"""
+    """Simple role hierarchy for SaaS/AI apps
+
+    Each member carries its hierarchy ``level`` (owner can do everything), so
+    role checks compare two ints instead of looking both roles up in a dict.
+    """
 
-    OWNER = "OWNER"  # Organization owner
-    ADMIN = "ADMIN"  # Can manage users, billing
-    MEMBER = "MEMBER"  # Regular user
-    VIEWER = "VIEWER"  # Read-only access
-    API_KEY = "API_KEY"  # For programmatic access (AI apps need this!)
+    level: int
 
+    def __new__(cls, value: str, level: int) -> Self:
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.level = level
+        return member
 
-# Role hierarchy (owner can do everything)
-ROLE_HIERARCHY = {
-    UserRole.OWNER: 100,
-    UserRole.ADMIN: 75,
-    UserRole.MEMBER: 50,
-    UserRole.VIEWER: 25,
-    UserRole.API_KEY: 10,
-}
+    OWNER = "OWNER", 100  # Organization owner
+    ADMIN = "ADMIN", 75  # Can manage users, billing
+    MEMBER = "MEMBER", 50  # Regular user
+    VIEWER = "VIEWER", 25  # Read-only access
+    API_KEY = "API_KEY", 10  # For programmatic access (AI apps need this!)
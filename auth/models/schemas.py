@@ -1,10 +1,14 @@
 import re
+import uuid
 from datetime import datetime
 
-from pydantic import UUID4, BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from auth.models.enums import UserRole
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
 
 class UserBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -15,8 +19,10 @@ class UserBase(BaseModel):
     @field_validator("email")
     @classmethod
     def validate_email(cls, v: str) -> str:
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, v):
+        # Cheap structural check first so obviously malformed input never
+        # reaches the regex engine.
+        at = v.find("@")
+        if at <= 0 or v.rfind(".") < at or not _EMAIL_RE.match(v):
             raise ValueError("Email must be a valid email address")
         return v.lower()
 
@@ -30,9 +36,12 @@ class UserCreate(UserBase):
         if len(v) < 4:
             raise ValueError("Password must be at least 4 characters long")
 
-        has_alpha = any(c.isalpha() for c in v)
-        has_digit = any(c.isdigit() for c in v)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in v)
+        # Scan the distinct characters once; the class checks below then run
+        # in C via map/isdisjoint instead of per-character generator frames.
+        chars = set(v)
+        has_alpha = any(map(str.isalpha, chars))
+        has_digit = any(map(str.isdigit, chars))
+        has_special = not _SPECIAL_CHARS.isdisjoint(chars)
 
         if not has_alpha:
             raise ValueError("Password must contain at least one alphabetic character")
@@ -51,7 +60,7 @@ class UserInDB(UserBase):
 
 
 class UserOut(UserBase):
-    id: UUID4
+    id: uuid.UUID
     created_at: datetime
     updated_at: datetime
 
@@ -1,11 +1,36 @@
-from opentelemetry import trace
-from sqlalchemy import select
+import uuid
+from typing import Any
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.models.db import Token, User
 from auth.models.domain import TokenDTO, UserDTO
 from auth.models.mappers import TokenMapper, UserMapper
+from core.cache import TTLCache
+from core.database import on_commit
 from core.db.repository import Repository
+from core.tracing import get_tracer
+
+# Emails known to be registered, for the registration check only. Emails are
+# stored lowercased, so the key is the lowercased address. Only hits are
+# cached, so a newly registered user is visible immediately. Login never reads
+# this: credentials are always checked against the current row.
+_registered_emails: TTLCache[str, bool] = TTLCache(maxsize=10_000, ttl=30)
+
+# Owner of an active token, keyed by the token id string from the JWT.
+_users_by_token: TTLCache[str, UserDTO] = TTLCache(maxsize=10_000, ttl=60)
+
+
+def clear_user_caches() -> None:
+    """Drop all cached user lookups (after any user write)."""
+    _registered_emails.clear()
+    _users_by_token.clear()
+
+
+def forget_token(token_id: str) -> None:
+    """Drop the cached owner of a token (after it is deactivated)."""
+    _users_by_token.pop(token_id)
 
 
 class TokenRepository(Repository[TokenDTO, Token]):
@@ -14,16 +39,74 @@ class TokenRepository(Repository[TokenDTO, Token]):
 
 
 class UserRepository(Repository[UserDTO, User]):
-    tracer = trace.get_tracer(__name__)
-
     def __init__(self, session: AsyncSession):
         super().__init__(session, User, UserMapper)
 
     async def get_by_email(self, email: str) -> UserDTO | None:
-        with self.tracer.start_as_current_span("user_repository.get_by_email") as span:
-            span.set_attribute("user.email", email)
-            query = await self.session.execute(select(User).where(User.email == email))
-            user = query.scalar_one_or_none()
+        email = email.lower()
+        with get_tracer(__name__).start_as_current_span(
+            "user_repository.get_by_email"
+        ) as span:
+            # Sampled-out spans are non-recording; skip building attributes.
+            if span.is_recording():
+                span.set_attribute("user.email", email)
+            # Plain column rows: no ORM instance, identity map or history
+            query = await self.session.execute(
+                select(*self.mapper.columns).where(User.email == email)
+            )
+            user = query.one_or_none()
+            if user:
+                user_dto: UserDTO = self.mapper.from_db(user)
+                return user_dto
+            return None
+
+    async def is_email_registered(self, email: str) -> bool:
+        """Whether a user with this email exists, cached for 30s when it does."""
+        email = email.lower()
+        if _registered_emails.get(email):
+            return True
+        if await self.get_by_email(email) is None:
+            return False
+        _registered_emails.set(email, True)
+        return True
+
+    async def get_active_by_token_id(self, token_id: str) -> UserDTO | None:
+        """Return the owner of a token if the token is active and unexpired.
+
+        Checks the token and loads its user in a single joined query.
+        """
+        if cached := _users_by_token.get(token_id):
+            return cached
+
+        try:
+            token_uuid = uuid.UUID(token_id)
+        except ValueError:
+            return None
+
+        with get_tracer(__name__).start_as_current_span(
+            "user_repository.get_active_by_token_id"
+        ):
+            query = await self.session.execute(
+                select(*self.mapper.columns)
+                .join(Token, Token.user_id == User.id)
+                .where(
+                    Token.id == token_uuid,
+                    Token.is_active.is_(True),
+                    Token.expires_at > func.now(),
+                )
+            )
+            user = query.one_or_none()
             if user:
-                return self.mapper.from_db(user)  # type: ignore[no-any-return]
+                user_dto: UserDTO = self.mapper.from_db(user)
+                _users_by_token.set(token_id, user_dto)
+                return user_dto
             return None
+
+    async def update(self, uid: Any, attrs: dict[str, Any]) -> UserDTO:
+        user_dto = await super().update(uid, attrs)
+        on_commit(self.session, clear_user_caches)
+        return user_dto
+
+    async def delete(self, uid: Any) -> None:
+        await super().delete(uid)
+        on_commit(self.session, clear_user_caches)
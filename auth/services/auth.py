@@ -1,57 +1,202 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
 from typing import Annotated, Any
 
+import bcrypt
+import jwt
+import orjson
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
-from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.models.domain import CreateTokenDTO, CreateUserDTO, UserDTO
 from auth.models.mappers import UserMapper
 from auth.models.schemas import AuthCreds, TokenBase, TokenOut, UserCreate, UserOut
-from auth.repositories.auth import TokenRepository, UserRepository
-from core.database import get_db_session
+from auth.repositories.auth import TokenRepository, UserRepository, forget_token
+from core.database import get_db_session, on_commit
 from core.exceptions import AlreadyRegisteredException, UnauthorizedException
 from core.settings import JWTConfig, Settings, get_settings
+from core.tracing import get_tracer
+
+TOKEN_ISSUER = "fastapi-skeleton"
 
 security = HTTPBearer()
 AuthHeaderDep = Annotated[HTTPAuthorizationCredentials, Depends(security)]
 
 
+def _b64url(data: bytes) -> bytes:
+    """Unpadded URL-safe base64, as used for JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode an unpadded URL-safe base64 JWT segment."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
 class PasswordService:
-    """Service for password hashing and verification."""
+    """Service for password hashing and verification.
+
+    bcrypt is deliberately slow (2^rounds iterations), so hashing and
+    verification run in a worker thread to keep the event loop responsive.
+    The bcrypt C extension releases the GIL while it works, so concurrent
+    logins hash in parallel.
+    """
+
+    # bcrypt only uses the first 72 bytes of a password
+    MAX_PASSWORD_BYTES = 72
 
-    def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
 
     async def verify_password(self, password: str, hashed_password: str) -> bool:
-        result: bool = self.pwd_context.verify(password, hashed_password)
+        result: bool = await asyncio.to_thread(
+            bcrypt.checkpw,
+            password.encode("utf-8")[: self.MAX_PASSWORD_BYTES],
+            hashed_password.encode("utf-8"),
+        )
         return result
 
     async def get_password_hash(self, password: str) -> str:
         """Hash a plain password."""
-        hashed: str = self.pwd_context.hash(password)
-        return hashed
+        hashed: bytes = await asyncio.to_thread(
+            bcrypt.hashpw,
+            password.encode("utf-8")[: self.MAX_PASSWORD_BYTES],
+            bcrypt.gensalt(rounds=self.rounds),
+        )
+        return hashed.decode("ascii")
+
+
+class TokenSigner:
+    """Signs and verifies JWTs for one key and algorithm.
+
+    Holds no request state, so a single instance per key is shared by every
+    TokenService (see get_token_signer).
+    """
+
+    def __init__(self, secret_key: str, algorithm: str):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        # The header never changes for a given algorithm, so encode it once
+        self._header_b64 = _b64url(orjson.dumps({"alg": self.algorithm, "typ": "JWT"}))
+        # Keyed once; each signature copies this instead of re-keying
+        self._hmac = hmac.new(self.secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        """Return the base64url HS256 signature of signing_input."""
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        return _b64url(mac.digest())
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        """Sign a JWT, with a fast path for HS256.
+
+        HS256 tokens are assembled directly from the cached header segment;
+        other algorithms go through PyJWT.
+        """
+        if self.algorithm != "HS256":
+            return jwt.encode(payload, self.secret_key, self.algorithm)
+        signing_input = self._header_b64 + b"." + _b64url(orjson.dumps(payload))
+        return (signing_input + b"." + self._sign(signing_input)).decode("ascii")
+
+    def _decode_hs256(self, encoded_token: str) -> dict[str, Any] | None:
+        """Verify and decode a token carrying our own HS256 header.
+
+        Returns None when the header differs from the cached one, so the
+        caller can fall back to PyJWT. Applies the same checks as the PyJWT
+        path: signature, exp, nbf, iat, aud, iss, sub and jti.
+
+        Raises:
+            jwt.InvalidTokenError: If the token fails any check
+        """
+        try:
+            header, payload_b64, signature = encoded_token.encode("ascii").split(b".")
+        except ValueError:
+            raise jwt.DecodeError("Not enough or too many segments")
+        if header != self._header_b64:
+            return None
+
+        expected = self._sign(header + b"." + payload_b64)
+        if not hmac.compare_digest(expected, signature):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+
+        try:
+            payload = orjson.loads(_b64url_decode(payload_b64))
+        except ValueError:
+            raise jwt.DecodeError("Invalid payload")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload")
+
+        now = time.time()
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            raise jwt.MissingRequiredClaimError("exp")
+        if exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        nbf = payload.get("nbf")
+        if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+            raise jwt.ImmatureSignatureError("The token is not yet valid")
+        iat = payload.get("iat")
+        if iat is not None:
+            if not isinstance(iat, (int, float)):
+                raise jwt.InvalidIssuedAtError("Issued At claim (iat) must be a number")
+            if iat > now:
+                raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+        # No audience is configured, so PyJWT refuses any token naming one
+        if "aud" in payload:
+            raise jwt.InvalidAudienceError("Invalid audience")
+        if "jti" in payload and not isinstance(payload["jti"], str):
+            raise jwt.exceptions.InvalidJTIError("JWT ID must be a string")
+        if payload.get("iss") != TOKEN_ISSUER:
+            raise jwt.InvalidIssuerError("Invalid issuer")
+        if not isinstance(payload.get("sub"), str):
+            raise jwt.MissingRequiredClaimError("sub")
+        return payload
+
+    def decode(self, encoded_token: str) -> dict[str, Any]:
+        """Decode a JWT token."""
+        try:
+            if self.algorithm == "HS256" and (
+                payload := self._decode_hs256(encoded_token)
+            ):
+                return payload
+            decoded: dict[str, Any] = jwt.decode(
+                encoded_token,
+                self.secret_key,
+                algorithms=[self.algorithm],
+                issuer=TOKEN_ISSUER,
+                options={"require": ["exp", "iss", "sub"]},
+            )
+            return decoded
+        except jwt.InvalidTokenError:
+            raise UnauthorizedException
+
+
+@lru_cache
+def get_token_signer(secret_key: str, algorithm: str) -> TokenSigner:
+    """Shared TokenSigner for a key and algorithm."""
+    return TokenSigner(secret_key, algorithm)
 
 
 class TokenService:
     """Service for JWT token creation, validation, and management.
 
     Note: This service is separate from TokenRepository to maintain
-    single responsibility principle.
+    single responsibility principle. Signing is delegated to a shared
+    TokenSigner; only the repository is per request.
     """
 
-    tracer = trace.get_tracer(__name__)
-
     def __init__(self, token_repository: TokenRepository, jwt_config: JWTConfig):
         self.token_repository = token_repository
         self.jwt_config = jwt_config
-        self.secret_key = jwt_config.secret_key
-        self.algorithm = jwt_config.algorithm
+        self.signer = get_token_signer(jwt_config.secret_key, jwt_config.algorithm)
         self.default_timedelta = timedelta(
             minutes=jwt_config.access_token_expire_minutes
         )
@@ -60,15 +205,19 @@ class TokenService:
         self, data: UserDTO, expires_delta: timedelta | None = None
     ) -> str:
         """Create a new JWT access token for a user."""
-        with self.tracer.start_as_current_span("token.create_access_token") as span:
-            span.set_attribute("user.id", str(data.id))
-
+        with get_tracer(__name__).start_as_current_span(
+            "token.create_access_token"
+        ) as span:
             if expires_delta is None:
                 expires_delta = self.default_timedelta
             expiry = datetime.now(timezone.utc) + expires_delta
-            span.set_attribute(
-                "auth.expires_minutes", expires_delta.total_seconds() / 60
-            )
+            if span.is_recording():
+                span.set_attributes(
+                    {
+                        "user.id": str(data.id),
+                        "auth.expires_minutes": expires_delta.total_seconds() / 60,
+                    }
+                )
 
             # Create CreateTokenDTO with required fields
             create_token_dto = CreateTokenDTO(
@@ -84,28 +233,20 @@ class TokenService:
             serialized_data = {
                 "id": str(data.id),
                 "exp": int(expiry.timestamp()),
-                "iss": "fastapi-skeleton",
+                "iss": TOKEN_ISSUER,
                 "sub": str(token_id),
             }
-            encoded_jwt: str = jwt.encode(
-                serialized_data, self.secret_key, self.algorithm
-            )
-            return encoded_jwt
+            return self.signer.encode(serialized_data)
 
     async def deactivate(self, token_id_str: str) -> None:
         """Deactivate a token by ID."""
         token_id = uuid.UUID(token_id_str)
         await self.token_repository.update(token_id, {"is_active": False})
+        on_commit(self.token_repository.session, partial(forget_token, token_id_str))
 
     def decode(self, encoded_token: str) -> dict[str, Any]:
         """Decode a JWT token."""
-        try:
-            decoded: dict[str, Any] = jwt.decode(
-                encoded_token, self.secret_key, algorithms=[self.algorithm]
-            )
-            return decoded
-        except JWTError:
-            raise UnauthorizedException
+        return self.signer.decode(encoded_token)
 
     async def validate(self, token_id_str: str) -> bool:
         """Validate that a token exists and is active."""
@@ -117,8 +258,6 @@ class TokenService:
 class AuthService:
     """Authentication service handling user registration, login, and token management."""
 
-    tracer = trace.get_tracer(__name__)
-
     def __init__(
         self,
         session: AsyncSession,
@@ -132,8 +271,8 @@ class AuthService:
         self.user_mapper = UserMapper
 
     async def register_user(self, user: UserCreate) -> UserOut:
-        with self.tracer.start_as_current_span("auth.register") as span:
-            if await self.user_repo.get_by_email(user.email):
+        with get_tracer(__name__).start_as_current_span("auth.register") as span:
+            if await self.user_repo.is_email_registered(user.email):
                 span.set_status(Status(StatusCode.ERROR, "User already registered"))
                 raise AlreadyRegisteredException
             hashed_password = await self.password_service.get_password_hash(
@@ -148,15 +287,17 @@ class AuthService:
             user_dto = await self.user_repo.create(create_user_dto)
             span.set_status(Status(StatusCode.OK), "user_registered")
 
-            return UserOut(
+            # Values come straight back from the database, which only ever
+            # received validated input, so skip re-running the validators.
+            return UserOut.model_construct(
                 email=user_dto.email,
                 id=user_dto.id,
                 created_at=user_dto.created_at,
-                updated_at=user_dto.updated_at,  # type: ignore
+                updated_at=user_dto.updated_at,
             )
 
     async def authenticate_user(self, login_user: AuthCreds) -> TokenOut:
-        with self.tracer.start_as_current_span("auth.authenticate") as span:
+        with get_tracer(__name__).start_as_current_span("auth.authenticate") as span:
             if not (user := await self.user_repo.get_by_email(login_user.email)):
                 span.set_status(Status(StatusCode.ERROR, "User not found"))
                 raise UnauthorizedException
@@ -171,19 +312,20 @@ class AuthService:
             return TokenOut(access_token=jwt)
 
     async def get_current_user(self, token: TokenBase) -> UserOut:
-        with self.tracer.start_as_current_span("auth.current_user") as span:
+        with get_tracer(__name__).start_as_current_span("auth.current_user") as span:
             payload = self.token_service.decode(token.access_token)
-            if not await self.token_service.validate(str(payload.get("sub"))):
-                span.set_status(Status(StatusCode.ERROR, "invalid_token"))
-                raise UnauthorizedException
             if not (id := payload.get("id")):
                 span.set_status(Status(StatusCode.ERROR, "missing_user_id"))
                 raise UnauthorizedException
-            if not (user_dto := await self.user_repo.get(id)):
-                span.set_status(Status(StatusCode.ERROR, "user_not_found"))
+            # One query checks the token is active and loads its owner
+            user_dto = await self.user_repo.get_active_by_token_id(
+                str(payload.get("sub"))
+            )
+            if not user_dto or str(user_dto.id) != id:
+                span.set_status(Status(StatusCode.ERROR, "invalid_token"))
                 raise UnauthorizedException
             span.set_status(Status(StatusCode.OK), "user_authenticated")
-            return UserOut(
+            return UserOut.model_construct(
                 email=user_dto.email,
                 id=user_dto.id,
                 role=user_dto.role,
@@ -196,9 +338,17 @@ class AuthService:
         await self.token_service.deactivate(str(payload.get("sub")))
 
 
-def get_password_service() -> PasswordService:
+@lru_cache
+def _password_service(rounds: int) -> PasswordService:
+    """Shared PasswordService per cost factor; it holds no request state."""
+    return PasswordService(rounds=rounds)
+
+
+def get_password_service(
+    settings: Settings = Depends(get_settings),
+) -> PasswordService:
     """Dependency to get password service instance."""
-    return PasswordService()
+    return _password_service(settings.bcrypt_rounds)
 
 
 def get_token_service(
@@ -0,0 +1,54 @@
+"""Small in-process caches for hot, rarely changing lookups.
+
+Entries live for a fixed time-to-live and the cache is bounded in size.
+It is per process: other workers only see a change once their entry
+expires, so keep TTLs short and invalidate locally on writes.
+"""
+
+import time
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded mapping whose entries expire ``ttl`` seconds after being set.
+
+    When full, the oldest entry is evicted. All entries share the same TTL,
+    so insertion order is also expiry order.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[K, tuple[V, float]] = {}
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (value, time.monotonic() + self.ttl)
+
+    def pop(self, key: K) -> None:
+        """Drop a single entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,13 +1,16 @@
+from collections.abc import Callable
 from contextlib import asynccontextmanager
-from typing import Annotated, AsyncGenerator
+from typing import Annotated, Any, AsyncGenerator
 
 from fastapi.params import Depends
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import NullPool
 
 from core.instrumentation import setup_db_metrics
-from core.settings import get_settings
+from core.settings import DatabaseConfig, get_settings
 
 
 class Base(DeclarativeBase):
@@ -16,17 +19,40 @@ class Base(DeclarativeBase):
     pass
 
 
+def engine_options(config: DatabaseConfig) -> dict[str, Any]:
+    """Build create_async_engine keyword arguments from database config."""
+    options: dict[str, Any] = {
+        "echo": config.echo,
+        "insertmanyvalues_page_size": config.insertmanyvalues_page_size,
+    }
+    if config.use_pgbouncer:
+        # PgBouncer owns the pool; a second pool here only holds idle
+        # server connections open.
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_recycle=config.pool_recycle,
+            pool_pre_ping=config.pool_pre_ping,
+        )
+    if config.url.startswith("postgresql+asyncpg://"):
+        # JIT compilation costs more than it saves on short OLTP queries
+        connect_args: dict[str, Any] = {"server_settings": {"jit": "off"}}
+        if config.use_pgbouncer:
+            # Prepared statements do not survive PgBouncer transaction mode
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+        options["connect_args"] = connect_args
+    return options
+
+
 # Get database configuration
 settings = get_settings()
 db_config = settings.get_database_config()
 
 # Create async engine with configuration
-engine = create_async_engine(
-    db_config.url,
-    echo=db_config.echo,
-    pool_size=db_config.pool_size,
-    max_overflow=db_config.max_overflow,
-)
+engine = create_async_engine(db_config.url, **engine_options(db_config))
 
 SQLAlchemyInstrumentor().instrument(engine=engine.sync_engine)
 setup_db_metrics(engine.sync_engine)
@@ -43,12 +69,40 @@ async_session = async_sessionmaker(
 )
 
 
+# Session.info key holding the callbacks registered with on_commit
+_POST_COMMIT = "post_commit_callbacks"
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run callback once the session's current transaction has committed.
+
+    For cache invalidation: evicting before the commit lets a concurrent
+    request read the old committed row and cache it again. Callbacks are
+    dropped if the transaction rolls back.
+    """
+    session.info.setdefault(_POST_COMMIT, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_post_commit(session: Session) -> None:
+    for callback in session.info.pop(_POST_COMMIT, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_post_commit(session: Session) -> None:
+    session.info.pop(_POST_COMMIT, None)
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for FastAPI - yields a database session."""
     async with async_session() as session:
         try:
             yield session
-            await session.commit()  # Commit on successful completion
+            # Commit on successful completion. Requests served entirely from
+            # cache never start a transaction, so there is nothing to commit.
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
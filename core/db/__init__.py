@@ -5,6 +5,7 @@ including repositories, mappers, and interfaces that can be reused
 across different domains.
 """
 
+from core.db.ids import uuid7
 from core.db.interfaces import IMapper, IRepository
 from core.db.mappers import GenericMapper
 from core.db.repository import Repository
@@ -14,4 +15,5 @@ __all__ = [
     "IRepository",
     "GenericMapper",
     "Repository",
+    "uuid7",
 ]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Sequence
 from typing import Any, Generic, Protocol, TypeVar
 
 T = TypeVar("T")
@@ -11,14 +12,26 @@ class IMapper(Protocol):
 
     def from_db(self, model: Any) -> Any: ...
 
+    def from_db_batch(self, models: Iterable[Any]) -> list[Any]: ...
+
     def to_db_new(self, dto: Any) -> Any: ...
 
+    def to_insert_values(self, dto: Any) -> dict[str, Any]: ...
+
 
 class IRepository(ABC, Generic[T]):
     @abstractmethod
     async def list(self, skip: int, take: int) -> list[T]:
         pass
 
+    @abstractmethod
+    async def list_after(self, last_id: Any | None, take: int) -> Sequence[T]:
+        pass
+
+    @abstractmethod
+    def list_stream(self, skip: int, take: int) -> AsyncIterator[T]:
+        pass
+
     @abstractmethod
     async def get(self, uid: int) -> T:
         pass
@@ -27,6 +40,10 @@ class IRepository(ABC, Generic[T]):
     async def create(self, record: Any) -> T:
         pass
 
+    @abstractmethod
+    async def create_many(self, records: Sequence[Any]) -> Sequence[T]:
+        pass
+
     @abstractmethod
     async def update(self, uid: Any, attrs: dict[str, Any]) -> T:
         pass
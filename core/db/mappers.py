@@ -4,8 +4,9 @@ This module provides a generic, type-safe mapper that automatically handles
 conversions using dataclass field introspection, eliminating repetitive code.
 """
 
+from collections.abc import Iterable
 from dataclasses import fields, is_dataclass
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Callable, Generic, Type, TypeVar
 
 TDto = TypeVar("TDto")
 TModel = TypeVar("TModel")
@@ -21,12 +22,16 @@ class GenericMapper(Generic[TDto, TModel]):
         # Create a mapper instance
         UserMapper = GenericMapper[UserDTO, User](UserDTO, User)
 
-        # Convert ORM to DTO
+        # Convert ORM to DTO (a row from select(*UserMapper.columns) works too)
         user_dto = UserMapper.from_db(user_model)
+        user_dtos = UserMapper.from_db_batch(user_models)
 
         # Create new ORM model
         new_user = UserMapper.to_db_new(create_user_dto)
 
+        # Values for a bulk INSERT
+        values = UserMapper.to_insert_values(create_user_dto)
+
         # Update existing model
         UserMapper.apply_update(user_model, update_user_dto)
     """
@@ -40,10 +45,105 @@ class GenericMapper(Generic[TDto, TModel]):
         """
         self.dto_class = dto_class
         self.model_class = model_class
+        self._from_db, self._from_db_batch = self._build_readers()
+        # Model attributes backing the DTO, for column-only selects whose
+        # rows can be passed straight to from_db
+        self.columns: tuple[Any, ...] = tuple(
+            getattr(model_class, f.name)
+            for f in fields(dto_class)  # type: ignore[arg-type]
+            if hasattr(model_class, f.name)
+        )
+        # Compiled insert builders and update field names per DTO type,
+        # resolved on first use
+        self._insert_fns: dict[type, Callable[[Any], dict[str, Any]]] = {}
+        self._update_fields: dict[type, tuple[str, ...]] = {}
+
+    def _build_readers(
+        self,
+    ) -> tuple[Callable[[TModel], TDto], Callable[[Iterable[TModel]], list[TDto]]]:
+        """Compile from_db and from_db_batch for this DTO/model pair.
+
+        The DTO fields present on the model class are resolved once and
+        written out as literal attribute reads, the same way dataclasses
+        generates ``__init__``, so mapping a row does no reflection.
+
+        Raises:
+            TypeError: If DTO class is not a dataclass
+        """
+        if not is_dataclass(self.dto_class):
+            raise TypeError(f"{self.dto_class.__name__} must be a dataclass")
+
+        names = [
+            f.name for f in fields(self.dto_class) if hasattr(self.model_class, f.name)
+        ]
+        args = ", ".join(f"{name}=model.{name}" for name in names)
+        source = (
+            "def from_db(model):\n"
+            "    if not model:\n"
+            "        raise ValueError(_none_message)\n"
+            f"    return _dto_class({args})\n"
+            "\n"
+            "def from_db_batch(models):\n"
+            f"    return [_dto_class({args}) for model in models]\n"
+        )
+        namespace: dict[str, Any] = {
+            "_dto_class": self.dto_class,
+            "_none_message": f"Cannot map None {self.model_class.__name__}",
+        }
+        # Source is built from dataclass field names only, never from input
+        exec(source, namespace)  # noqa: S102
+        return namespace["from_db"], namespace["from_db_batch"]
+
+    def _insert_values_fn(self, dto_type: type) -> Callable[[Any], dict[str, Any]]:
+        """Return a to_insert_values function compiled for a Create DTO type.
+
+        Like from_db, the field reads and None checks are written out once
+        per DTO type so building INSERT values does no reflection.
+
+        Raises:
+            TypeError: If dto_type is not a dataclass
+        """
+        try:
+            return self._insert_fns[dto_type]
+        except KeyError:
+            pass
+        if not is_dataclass(dto_type):
+            raise TypeError(f"{dto_type.__name__} must be a dataclass")
+        lines = ["def to_insert_values(dto):", "    values = {}"]
+        for f in fields(dto_type):
+            lines.append(f"    if (value := dto.{f.name}) is not None:")
+            lines.append(f"        values[{f.name!r}] = value")
+        lines.append("    return values")
+        namespace: dict[str, Any] = {}
+        # Source is built from dataclass field names only, never from input
+        exec("\n".join(lines) + "\n", namespace)  # noqa: S102
+        fn: Callable[[Any], dict[str, Any]] = namespace["to_insert_values"]
+        self._insert_fns[dto_type] = fn
+        return fn
+
+    def _update_fields_for(self, dto_type: type) -> tuple[str, ...]:
+        """Return the Update DTO fields that exist on the model, cached per type.
+
+        Raises:
+            TypeError: If dto_type is not a dataclass
+        """
+        try:
+            return self._update_fields[dto_type]
+        except KeyError:
+            pass
+        if not is_dataclass(dto_type):
+            raise TypeError(f"{dto_type.__name__} must be a dataclass")
+        names = tuple(
+            f.name for f in fields(dto_type) if hasattr(self.model_class, f.name)
+        )
+        self._update_fields[dto_type] = names
+        return names
 
     def from_db(self, model: TModel) -> TDto:
         """Convert ORM model to DTO by mapping matching field names.
 
+        Delegates to the function compiled in ``__init__``.
+
         Args:
             model: SQLAlchemy ORM model instance
 
@@ -52,23 +152,22 @@ class GenericMapper(Generic[TDto, TModel]):
 
         Raises:
             ValueError: If model is None
-            TypeError: If DTO class is not a dataclass
         """
-        if not model:
-            raise ValueError(f"Cannot map None {self.model_class.__name__}")
+        return self._from_db(model)
 
-        if not is_dataclass(self.dto_class):
-            raise TypeError(f"{self.dto_class.__name__} must be a dataclass")
+    def from_db_batch(self, models: Iterable[TModel]) -> list[TDto]:
+        """Convert a sequence of ORM models (or rows) to DTOs.
 
-        # Get all DTO fields and map from model attributes
-        dto_fields = {f.name for f in fields(self.dto_class)}
-        kwargs = {}
+        Delegates to the function compiled in ``__init__``, which maps the
+        whole page in one comprehension without a call per row.
 
-        for field_name in dto_fields:
-            if hasattr(model, field_name):
-                kwargs[field_name] = getattr(model, field_name)
+        Args:
+            models: SQLAlchemy ORM model instances or column rows
 
-        return self.dto_class(**kwargs)  # type: ignore[return-value]
+        Returns:
+            DTOs in the same order
+        """
+        return self._from_db_batch(models)
 
     def to_db_new(self, create_dto: Any) -> TModel:
         """Convert Create DTO to new ORM model instance.
@@ -86,19 +185,28 @@ class GenericMapper(Generic[TDto, TModel]):
             ValueError: If DTO is None
             TypeError: If create_dto is not a dataclass
         """
-        if not create_dto:
-            raise ValueError("Cannot map None create_dto")
+        return self.model_class(**self.to_insert_values(create_dto))
 
-        if not is_dataclass(create_dto):
-            raise TypeError(f"{type(create_dto).__name__} must be a dataclass")
+    def to_insert_values(self, create_dto: Any) -> dict[str, Any]:
+        """Convert Create DTO to a column-value dict for a Core/ORM INSERT.
 
-        # Get all fields from the Create DTO
-        dto_fields = {f.name: getattr(create_dto, f.name) for f in fields(create_dto)}
+        None values are dropped so column defaults apply, matching to_db_new.
 
-        # Filter out None values and create model
-        kwargs = {k: v for k, v in dto_fields.items() if v is not None}
+        Args:
+            create_dto: Create DTO (e.g., CreateUserDTO, CreateTokenDTO)
 
-        return self.model_class(**kwargs)
+        Returns:
+            Mapping of column attribute names to values
+
+        Raises:
+            ValueError: If DTO is None
+            TypeError: If create_dto is not a dataclass
+        """
+        if not create_dto:
+            raise ValueError("Cannot map None create_dto")
+
+        # Get all fields from the Create DTO, filtering out None values
+        return self._insert_values_fn(type(create_dto))(create_dto)
 
     def apply_update(self, model: TModel, update_dto: Any) -> None:
         """Apply Update DTO fields to existing model.
@@ -112,11 +220,8 @@ class GenericMapper(Generic[TDto, TModel]):
         Raises:
             TypeError: If update_dto is not a dataclass
         """
-        if not is_dataclass(update_dto):
-            raise TypeError(f"{type(update_dto).__name__} must be a dataclass")
-
         # Update only non-None fields from the Update DTO
-        for field in fields(update_dto):
-            value = getattr(update_dto, field.name)
-            if value is not None and hasattr(model, field.name):
-                setattr(model, field.name, value)
+        for name in self._update_fields_for(type(update_dto)):
+            value = getattr(update_dto, name)
+            if value is not None:
+                setattr(model, name, value)
@@ -1,22 +1,46 @@
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Generic, Type, TypeVar
 
-from opentelemetry import trace
-from opentelemetry.trace import Status, StatusCode
-from sqlalchemy import select
+from opentelemetry.trace import Span, Status, StatusCode
+from sqlalchemy import Select, bindparam, delete, insert, inspect, select, update
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.interfaces import IMapper, IRepository
+from core.tracing import get_tracer
 
 TDto = TypeVar("TDto")
 TModel = TypeVar("TModel")
 
+# Caps the field names recorded on update spans; payloads can be wide.
+_MAX_UPDATE_FIELDS = 16
+
+
+@lru_cache
+def _select_by_id(model_class: type) -> Select[Any]:
+    """SELECT of one row by primary key, built once per model.
+
+    The id is a bind parameter, so every lookup reuses the same statement
+    object and hits SQLAlchemy's compiled cache without rebuilding it.
+    """
+    return select(model_class).where(model_class.id == bindparam("id"))  # type: ignore[attr-defined]
+
+
+@lru_cache
+def _allowed_columns(model_class: type) -> frozenset[str]:
+    """Names of the mapped columns of a model, computed once per model.
+
+    Updates are filtered against this set, so relationships and other
+    non-column attributes can never be written.
+    """
+    return frozenset(inspect(model_class).columns.keys())
+
 
 class Repository(IRepository[TDto], Generic[TDto, TModel]):
     """Generic repository implementation for CRUD operations."""
 
-    tracer = trace.get_tracer(__name__)
-
     def __init__(
         self,
         session: AsyncSession,
@@ -27,30 +51,100 @@ class Repository(IRepository[TDto], Generic[TDto, TModel]):
         self._model_class = model_class
         self.mapper = mapper
 
+    @contextmanager
+    def _span(self, name: str) -> Iterator[Span]:
+        """Start a current span for a repository operation.
+
+        Attributes are only built when the span is sampled; callers follow
+        the same rule with ``span.is_recording()`` for their own attributes.
+        """
+        with get_tracer(__name__).start_as_current_span(name) as span:
+            if span.is_recording():
+                span.set_attribute("db.model", self._model_class.__name__)
+            yield span
+
     async def list(self, skip: int, take: int) -> list[TDto]:
-        with self.tracer.start_as_current_span(
-            "repository.list",
-            attributes={
-                "db.model": self._model_class.__name__,
-                "db.skip": skip,
-                "db.limit": take,
-            },
-        ) as span:
+        with self._span("repository.list") as span:
+            if span.is_recording():
+                span.set_attributes({"db.skip": skip, "db.limit": take})
             result = await self.session.execute(
                 select(self._model_class).offset(skip).limit(take)
             )
-            items = [self.mapper.from_db(r) for r in result.scalars().all()]
+            items: list[TDto] = self.mapper.from_db_batch(result.scalars().all())
             span.set_attribute("db.result_count", len(items))
             return items
 
+    async def list_after(self, last_id: Any | None, take: int) -> Sequence[TDto]:
+        """Return the next page of rows ordered by id (keyset pagination).
+
+        Seeks past ``last_id`` through the primary key index, so a deep page
+        costs the same as the first one, unlike OFFSET which scans and
+        discards every skipped row. Ids are UUIDv7, so id order follows
+        creation time (to the millisecond).
+
+        Args:
+            last_id: Id of the last row of the previous page, or None for
+                the first page
+            take: Maximum number of rows to return
+
+        Returns:
+            DTOs ordered by id; the last one's id is the next cursor
+        """
+        model_id = self._model_class.id  # type: ignore[attr-defined]
+        with self._span("repository.list_after") as span:
+            if span.is_recording():
+                span.set_attribute("db.limit", take)
+            stmt = select(self._model_class).order_by(model_id).limit(take)
+            if last_id is not None:
+                stmt = stmt.where(model_id > last_id)
+            result = await self.session.execute(stmt)
+            items: list[TDto] = self.mapper.from_db_batch(result.scalars().all())
+            span.set_attribute("db.result_count", len(items))
+            return items
+
+    async def list_stream(
+        self, skip: int, take: int, batch_size: int = 500
+    ) -> AsyncIterator[TDto]:
+        """Yield DTOs as rows arrive instead of materializing the whole page.
+
+        Rows are fetched from a server-side cursor ``batch_size`` at a time,
+        so peak memory is bounded by the batch rather than by ``take``.
+
+        Args:
+            skip: Number of rows to skip
+            take: Maximum number of rows to return
+            batch_size: Rows buffered per fetch from the cursor
+        """
+        # The span is ended manually: a generator may be resumed from a
+        # different context, so it cannot be made the current span.
+        span = get_tracer(__name__).start_span("repository.list_stream")
+        if span.is_recording():
+            span.set_attributes(
+                {
+                    "db.model": self._model_class.__name__,
+                    "db.skip": skip,
+                    "db.limit": take,
+                }
+            )
+        count = 0
+        try:
+            result = await self.session.stream_scalars(
+                select(self._model_class)
+                .offset(skip)
+                .limit(take)
+                .execution_options(yield_per=batch_size)
+            )
+            async for row in result:
+                count += 1
+                yield self.mapper.from_db(row)
+        finally:
+            span.set_attribute("db.result_count", count)
+            span.end()
+
     async def get(self, uid: Any) -> TDto:
-        with self.tracer.start_as_current_span(
-            "repository.get",
-            attributes={
-                "db.model": self._model_class.__name__,
-                "db.id": str(uid),
-            },
-        ) as span:
+        with self._span("repository.get") as span:
+            if span.is_recording():
+                span.set_attribute("db.id", str(uid))
             try:
                 entity = await self._get(uid)
                 return self.mapper.from_db(entity)  # type: ignore[no-any-return]
@@ -68,18 +162,19 @@ class Repository(IRepository[TDto], Generic[TDto, TModel]):
         Returns:
             Full DTO of the created entity
         """
-        with self.tracer.start_as_current_span(
-            "repository.create",
-            attributes={
-                "db.model": self._model_class.__name__,
-            },
-        ) as span:
+        with self._span("repository.create") as span:
             try:
-                entity = self.mapper.to_db_new(record)
-                self.session.add(entity)
-                await self.session.flush()  # Flush to get the ID
-                await self.session.refresh(entity)
-                span.set_attribute("db.created_id", str(entity.id))  # type: ignore
+                # INSERT ... RETURNING hands back the server-generated id and
+                # timestamps in the same round-trip, instead of a flush
+                # followed by a refresh SELECT.
+                result = await self.session.execute(
+                    insert(self._model_class)
+                    .values(**self.mapper.to_insert_values(record))
+                    .returning(self._model_class)
+                )
+                entity = result.scalar_one()
+                if span.is_recording():
+                    span.set_attribute("db.created_id", str(entity.id))  # type: ignore
                 created_dto = self.mapper.from_db(entity)
                 return created_dto  # type: ignore[no-any-return]
             except Exception as e:
@@ -87,53 +182,84 @@ class Repository(IRepository[TDto], Generic[TDto, TModel]):
                 span.set_status(Status(StatusCode.ERROR, "Create failed"))
                 raise
 
-    async def update(self, uid: Any, attrs: dict[str, Any]) -> TDto:
-        with self.tracer.start_as_current_span(
-            "repository.update",
-            attributes={
-                "db.model": self._model_class.__name__,
-                "db.id": str(uid),
-                "db.update_fields": list(attrs.keys()),
-            },
-        ) as span:
+    async def create_many(self, records: Sequence[Any]) -> Sequence[TDto]:
+        """Create entities from Create DTOs in a single INSERT statement.
+
+        Rows are sent as batched multi-VALUES statements (see
+        ``insertmanyvalues_page_size``) instead of one round-trip per row.
+
+        Args:
+            records: Create DTOs (e.g., CreateUserDTO, CreateTokenDTO)
+
+        Returns:
+            Full DTOs of the created entities, in the order given
+        """
+        with self._span("repository.create_many") as span:
+            if span.is_recording():
+                span.set_attribute("db.record_count", len(records))
+            if not records:
+                return []
             try:
-                entity = await self._get(uid)
-            except NoResultFound as e:
+                result = await self.session.execute(
+                    insert(self._model_class).returning(
+                        self._model_class, sort_by_parameter_order=True
+                    ),
+                    [self.mapper.to_insert_values(r) for r in records],
+                )
+                return self.mapper.from_db_batch(result.scalars().all())  # type: ignore[no-any-return]
+            except Exception as e:
                 span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR, "Entity not found"))
-                raise ValueError(f"{self._model_class.__name__} not found.")
-
-            for key, value in attrs.items():
-                if hasattr(entity, key):  # Only update fields that exist on ORM
-                    setattr(entity, key, value)
+                span.set_status(Status(StatusCode.ERROR, "Create failed"))
+                raise
 
+    async def update(self, uid: Any, attrs: dict[str, Any]) -> TDto:
+        with self._span("repository.update") as span:
+            if span.is_recording():
+                span.set_attributes(
+                    {
+                        "db.id": str(uid),
+                        "db.update_fields": list(attrs)[:_MAX_UPDATE_FIELDS],
+                    }
+                )
+            # Only update fields that are columns of the ORM model
+            columns = _allowed_columns(self._model_class)
+            values = {k: v for k, v in attrs.items() if k in columns}
             try:
-                await self.session.flush()
-                await self.session.refresh(entity)
-                return self.mapper.from_db(entity)  # type: ignore[no-any-return]
+                # UPDATE ... RETURNING applies the change and hands back the
+                # new row in one round-trip, instead of SELECT, flush and a
+                # refresh SELECT.
+                result = await self.session.execute(
+                    update(self._model_class)
+                    .where(self._model_class.id == uid)  # type: ignore[attr-defined]
+                    .values(**values)
+                    .returning(self._model_class)
+                )
+                entity = result.scalar_one_or_none()
             except Exception as e:
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR, "Update failed"))
                 raise
 
-    async def delete(self, uid: int) -> None:
-        with self.tracer.start_as_current_span(
-            "repository.delete",
-            attributes={
-                "db.model": self._model_class.__name__,
-                "db.id": str(uid),
-            },
-        ) as span:
-            try:
-                entity = await self._get(uid)
-            except NoResultFound:
-                span.set_attribute("db.deleted", False)
-                return  # No-op if record doesn't exist
+            if entity is None:
+                span.set_status(Status(StatusCode.ERROR, "Entity not found"))
+                raise ValueError(f"{self._model_class.__name__} not found.")
+            return self.mapper.from_db(entity)  # type: ignore[no-any-return]
 
+    async def delete(self, uid: int) -> None:
+        with self._span("repository.delete") as span:
+            if span.is_recording():
+                span.set_attribute("db.id", str(uid))
             try:
-                await self.session.delete(entity)
-                await self.session.flush()
-                span.set_attribute("db.deleted", True)
+                # A single DELETE ... RETURNING; deleting a missing row is a
+                # no-op, so there is no need to SELECT it first.
+                result = await self.session.execute(
+                    delete(self._model_class)
+                    .where(self._model_class.id == uid)  # type: ignore[attr-defined]
+                    .returning(self._model_class.id)  # type: ignore[attr-defined]
+                )
+                span.set_attribute(
+                    "db.deleted", result.scalar_one_or_none() is not None
+                )
             except Exception as e:
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR, "Delete failed"))
@@ -141,7 +267,7 @@ class Repository(IRepository[TDto], Generic[TDto, TModel]):
 
     async def _get(self, entity_id: Any) -> TModel:
         result = await self.session.execute(
-            select(self._model_class).where(self._model_class.id == entity_id)  # type: ignore
+            _select_by_id(self._model_class), {"id": entity_id}
         )
         one: TModel = result.scalar_one()
         return one
@@ -0,0 +1,33 @@
+"""Portable column types shared by the ORM models."""
+
+from typing import Any
+
+from sqlalchemy import String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+
+class IPAddress(TypeDecorator[str]):
+    """IP address stored as native INET on PostgreSQL, VARCHAR(255) elsewhere.
+
+    INET is a compact binary type (7 bytes for IPv4, 19 for IPv6) that
+    indexes far more densely than text. Values are exposed as plain strings
+    on both backends, so callers never see driver-specific address objects.
+    The VARCHAR length matches the column the migrations leave on other
+    backends, so autogenerate sees no drift.
+    """
+
+    impl = String(255)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.INET())
+        return dialect.type_descriptor(String(255))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> str | None:
+        return None if value is None else str(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        return None if value is None else str(value)
@@ -11,6 +11,7 @@ from typing import Any, Dict, Optional
 import structlog
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
+from structlog.contextvars import get_contextvars
 
 logger = structlog.get_logger()
 
@@ -113,27 +114,31 @@ class ReadinessError(Exception):
 # ============================================================================
 
 
+_STATUS_MAP: dict[type[DomainException], int] = {
+    UserAlreadyExistsException: status.HTTP_400_BAD_REQUEST,
+    InvalidCredentialsException: status.HTTP_401_UNAUTHORIZED,
+    TokenExpiredException: status.HTTP_401_UNAUTHORIZED,
+    TokenInvalidException: status.HTTP_401_UNAUTHORIZED,
+    InsufficientPermissionsException: status.HTTP_403_FORBIDDEN,
+    ResourceNotFoundException: status.HTTP_404_NOT_FOUND,
+    ValidationException: status.HTTP_422_UNPROCESSABLE_ENTITY,
+}
+
+# Responses for these carry a WWW-Authenticate: Bearer challenge
+_BEARER_CHALLENGE_TYPES: frozenset[type[DomainException]] = frozenset(
+    {InvalidCredentialsException, TokenExpiredException, TokenInvalidException}
+)
+
+
 def domain_exception_to_http(
     exc: DomainException, correlation_id: Optional[str] = None
 ) -> HTTPException:
     """Convert domain exceptions to HTTP exceptions with appropriate status codes."""
 
-    status_map = {
-        UserAlreadyExistsException: status.HTTP_400_BAD_REQUEST,
-        InvalidCredentialsException: status.HTTP_401_UNAUTHORIZED,
-        TokenExpiredException: status.HTTP_401_UNAUTHORIZED,
-        TokenInvalidException: status.HTTP_401_UNAUTHORIZED,
-        InsufficientPermissionsException: status.HTTP_403_FORBIDDEN,
-        ResourceNotFoundException: status.HTTP_404_NOT_FOUND,
-        ValidationException: status.HTTP_422_UNPROCESSABLE_ENTITY,
-    }
-
-    status_code = status_map.get(type(exc), status.HTTP_500_INTERNAL_SERVER_ERROR)
+    status_code = _STATUS_MAP.get(type(exc), status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     headers = {}
-    if isinstance(
-        exc, (InvalidCredentialsException, TokenExpiredException, TokenInvalidException)
-    ):
+    if type(exc) in _BEARER_CHALLENGE_TYPES:
         headers["WWW-Authenticate"] = "Bearer"
 
     if correlation_id:
@@ -159,14 +164,15 @@ async def domain_exception_handler(
     request: Request, exc: DomainException
 ) -> JSONResponse:
     """Global handler for domain exceptions."""
-    correlation_id = request.headers.get("X-Correlation-ID")
+    # Bound by ObservabilityMiddleware, together with the request path, which
+    # merge_contextvars adds to the log line.
+    correlation_id = get_contextvars().get("correlation_id")
 
     logger.error(
         "domain_exception",
         exception_type=type(exc).__name__,
         message=exc.message,
         details=exc.details,
-        path=request.url.path,
     )
 
     http_exc = domain_exception_to_http(exc, correlation_id)
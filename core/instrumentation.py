@@ -4,23 +4,25 @@ from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from structlog.contextvars import get_contextvars
 
-from core.metrics import DB_ERROR_COUNT, DB_QUERY_DURATION
+from core.metrics import DB_ERROR_COUNT, DB_QUERY_DURATION, LabelCache
+
+_OPERATIONS = {
+    "select": "select",
+    "insert": "insert",
+    "update": "update",
+    "delete": "delete",
+}
 
 
 def get_operation(sql: str) -> str:
-    sql = sql.strip().lower()
-    if sql.startswith("select"):
-        return "select"
-    if sql.startswith("insert"):
-        return "insert"
-    if sql.startswith("update"):
-        return "update"
-    if sql.startswith("delete"):
-        return "delete"
-    return "other"
+    # Only the leading keyword is lowercased, not the whole statement
+    return _OPERATIONS.get(sql.lstrip()[:6].lower(), "other")
 
 
 def setup_db_metrics(engine: Engine, db_system: str = "postgres"):
+    durations = LabelCache(DB_QUERY_DURATION)
+    errors = LabelCache(DB_ERROR_COUNT)
+
     @event.listens_for(engine, "before_cursor_execute")
     def before_cursor_execute(
         conn, cursor, statement, parameters, context, executemany
@@ -34,24 +36,14 @@ def setup_db_metrics(engine: Engine, db_system: str = "postgres"):
 
         ctx = get_contextvars()
         method = ctx.get("method", "unknown")
-        path = ctx.get("path", "unknown")
+        path = ctx.get("route", "unknown")
 
-        DB_QUERY_DURATION.labels(
-            db_system=db_system,
-            operation=context._operation,
-            method=method,
-            path=path,
-        ).observe(duration)
+        durations.get(db_system, context._operation, method, path).observe(duration)
 
     @event.listens_for(engine, "handle_error")
     def handle_error(exception_context):
         ctx = get_contextvars()
         method = ctx.get("method", "unknown")
-        path = ctx.get("path", "unknown")
-
-        DB_ERROR_COUNT.labels(
-            db_system=db_system,
-            operation="unknown",
-            method=method,
-            path=path,
-        ).inc()
+        path = ctx.get("route", "unknown")
+
+        errors.get(db_system, "unknown", method, path).inc()
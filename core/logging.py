@@ -1,5 +1,12 @@
 import logging
+import queue
+import sys
+import threading
+import traceback
+from logging.handlers import QueueHandler, QueueListener
+from typing import BinaryIO
 
+import orjson
 import structlog
 from opentelemetry import trace
 from structlog.contextvars import merge_contextvars
@@ -26,52 +33,176 @@ def add_trace_ids(_, __, event_dict):
     return event_dict
 
 
+class QueuedWriter:
+    """Binary file-like sink that hands writes to a background thread.
+
+    The caller (the event loop) only enqueues; the thread does the blocking
+    write and flush. Before ``start`` and after ``stop`` writes go straight
+    to the stream, so nothing logged during startup or shutdown is lost.
+    The lock only orders writes against start and stop: a write racing
+    ``stop`` either lands before the sentinel or waits and goes direct.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._queue: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._error_reported = False
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._drain, name="log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self) -> None:
+        """Write out everything queued so far and stop the thread."""
+        # Held until the queue is drained, so direct writes that follow
+        # cannot overtake queued ones
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(None)
+                thread.join()
+
+    def write(self, data: bytes) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._stream.write(data)
+            else:
+                self._queue.put(data)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._stream.flush()
+
+    def _drain(self) -> None:
+        while (data := self._queue.get()) is not None:
+            try:
+                self._stream.write(data)
+                # One flush per burst rather than per line
+                if self._queue.empty():
+                    self._stream.flush()
+            except Exception:
+                self._report_error()
+        try:
+            self._stream.flush()
+        except Exception:
+            self._report_error()
+
+    def _report_error(self) -> None:
+        """Note a failed write on stderr, once, and keep draining.
+
+        Like logging.Handler.handleError: the line is dropped but the thread
+        survives, so one transient failure does not silence all later output.
+        """
+        if self._error_reported:
+            return
+        self._error_reported = True
+        sys.stderr.write("--- Logging error in log-writer thread ---\n")
+        traceback.print_exc(file=sys.stderr)
+
+
+_writer: QueuedWriter | None = None
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+_STDLIB_FORMAT = "%(message)s"
+
+
 def setup_logging():
-    """Configure structured logging with OpenTelemetry trace integration."""
+    """Configure structured logging with OpenTelemetry trace integration.
+
+    Log lines are written by background threads; call ``shutdown_logging``
+    on exit to flush them. Calling it again replaces the earlier setup.
+    """
+    global _writer, _listener, _queue_handler
     log_level = get_log_level()
+    # Stop the threads of any earlier setup rather than orphaning them
+    shutdown_logging()
 
+    # Stdlib logging only carries third-party loggers (uvicorn, SQLAlchemy);
+    # structlog events are written straight to stdout, bypassing its handler
+    # dispatch and locks. Both only enqueue on the calling thread.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
     logging.basicConfig(
         level=log_level,
-        format="%(message)s",
+        format=_STDLIB_FORMAT,
+        handlers=[_queue_handler],
+        # Replace existing root handlers instead of silently doing nothing
+        force=True,
     )
+    _listener = QueueListener(log_queue, logging.StreamHandler())
+    _listener.start()
+    _writer = QueuedWriter(sys.stdout.buffer)
+    _writer.start()
 
-    structlog.configure(
-        processors=[
-            merge_contextvars,
-            add_trace_ids,
-            structlog.processors.TimeStamper(fmt="iso"),
-            # If log level is too low, abort pipeline and throw away log entry.
-            structlog.stdlib.filter_by_level,
-            # Add the name of the logger to event dict.
-            structlog.stdlib.add_logger_name,
-            # Add log level to event dict.
-            structlog.stdlib.add_log_level,
-            # Perform %-style formatting.
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            # Add a timestamp in ISO 8601 format.
-            structlog.processors.TimeStamper(fmt="iso"),
-            # If the "stack_info" key in the event dict is true, remove it and
-            # render the current stack trace in the "stack" key.
-            structlog.processors.StackInfoRenderer(),
-            # If the "exc_info" key in the event dict is either true or a
-            # sys.exc_info() tuple, remove "exc_info" and render the exception
-            # with traceback into the "exception" key.
-            structlog.processors.format_exc_info,
-            # If some value is in bytes, decode it to a Unicode str.
-            structlog.processors.UnicodeDecoder(),
-            # Add callsite parameters.
+    processors = [
+        merge_contextvars,
+        add_trace_ids,
+        # Add log level to event dict.
+        structlog.processors.add_log_level,
+        # Add a timestamp in ISO 8601 format.
+        structlog.processors.TimeStamper(fmt="iso"),
+        # If the "stack_info" key in the event dict is true, remove it and
+        # render the current stack trace in the "stack" key.
+        structlog.processors.StackInfoRenderer(),
+        # If the "exc_info" key in the event dict is either true or a
+        # sys.exc_info() tuple, remove "exc_info" and render the exception
+        # with traceback into the "exception" key.
+        structlog.processors.format_exc_info,
+        # If some value is in bytes, decode it to a Unicode str.
+        structlog.processors.UnicodeDecoder(),
+    ]
+    if log_level == "DEBUG":
+        # Add callsite parameters. Walks the stack on every event, so only
+        # when debugging.
+        processors.append(
             structlog.processors.CallsiteParameterAdder(
                 {
                     structlog.processors.CallsiteParameter.FILENAME,
                     structlog.processors.CallsiteParameter.FUNC_NAME,
                     structlog.processors.CallsiteParameter.LINENO,
                 }
-            ),
-            # Render the final event dict as JSON.
-            structlog.processors.JSONRenderer(),
-        ],
+            )
+        )
+    # Render the final event dict as JSON bytes for the bytes logger.
+    processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+
+    structlog.configure(
+        processors=processors,
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.BytesLoggerFactory(_writer),  # type: ignore[arg-type]
+        # Drops calls below the configured level before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(log_level)
+        ),
         cache_logger_on_first_use=True,
     )
+
+
+def shutdown_logging() -> None:
+    """Flush queued log lines and stop the writer threads.
+
+    Later structlog events are written directly, and the root logger gets a
+    plain stream handler again so stdlib records are not left in a queue
+    nobody reads.
+    """
+    global _listener, _queue_handler
+    if _writer is not None:
+        _writer.stop()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        root = logging.getLogger()
+        root.removeHandler(_queue_handler)
+        _queue_handler = None
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(_STDLIB_FORMAT))
+        root.addHandler(handler)
@@ -1,4 +1,37 @@
+from typing import Any, Generic, TypeVar
+
 from prometheus_client import Counter, Histogram
+from prometheus_client.metrics import MetricWrapperBase
+
+M = TypeVar("M", bound=MetricWrapperBase)
+
+
+class LabelCache(Generic[M]):
+    """Bound children of a labelled metric, keyed by label values.
+
+    ``metric.labels(...)`` validates the values and takes the metric's lock
+    on every call; caching the child makes repeat observations a single
+    dict lookup. Entries are evicted oldest-first past ``maxsize`` so a
+    high-cardinality label (e.g. an unmatched path) cannot grow it forever.
+    """
+
+    def __init__(self, metric: M, maxsize: int = 1024):
+        self._metric = metric
+        self._maxsize = maxsize
+        self._children: dict[tuple[Any, ...], M] = {}
+
+    def get(self, *labels: Any) -> M:
+        """Return the child for label values given in labelnames order."""
+        try:
+            return self._children[labels]
+        except KeyError:
+            pass
+        if len(self._children) >= self._maxsize:
+            del self._children[next(iter(self._children))]
+        child: M = self._metric.labels(*labels)
+        self._children[labels] = child
+        return child
+
 
 REQUEST_COUNT = Counter(
     "request_count",
@@ -1,8 +1,17 @@
+import asyncio
+import time
+
 from sqlalchemy import text
 
 from core.database import get_db_session_context
 from core.exceptions import ReadinessError
 
+READINESS_CACHE_TTL = 1.0  # seconds; keep below the probe interval
+
+_checked_at = float("-inf")
+_ready = False
+_lock = asyncio.Lock()
+
 
 async def check_db_readiness():
     try:
@@ -10,3 +19,26 @@ async def check_db_readiness():
             await session.execute(text("SELECT 1"))
     except Exception as e:
         raise ReadinessError("DB not ready") from e
+
+
+async def cached_db_readiness(ttl: float = READINESS_CACHE_TTL) -> None:
+    """Run ``check_db_readiness`` at most once per ``ttl`` seconds.
+
+    Probes arriving within the window share the last result, failures
+    included, so a burst of probes (or a flapping DB) costs one round-trip
+    instead of one pooled connection per probe.
+
+    Raises:
+        ReadinessError: If the last check failed
+    """
+    global _checked_at, _ready
+    async with _lock:
+        if time.monotonic() - _checked_at >= ttl:
+            try:
+                await check_db_readiness()
+                _ready = True
+            except ReadinessError:
+                _ready = False
+            _checked_at = time.monotonic()
+    if not _ready:
+        raise ReadinessError("DB not ready")
@@ -2,7 +2,7 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 
-from auth.models.enums import ROLE_HIERARCHY, UserRole
+from auth.models.enums import UserRole
 from auth.models.schemas import UserOut
 from auth.services.auth import CurUserDep
 
@@ -10,11 +10,10 @@ from auth.services.auth import CurUserDep
 def has_min_role(minimum_role: UserRole):
     """User must have at least this role level"""
 
-    async def check(current_user: CurUserDep) -> UserOut:
-        user_level = ROLE_HIERARCHY.get(current_user.role, 0)
-        min_level = ROLE_HIERARCHY.get(minimum_role, 0)
+    min_level = minimum_role.level
 
-        if user_level < min_level:
+    async def check(current_user: CurUserDep) -> UserOut:
+        if current_user.role.level < min_level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Required minimum role: {minimum_role.value}",
@@ -2,7 +2,7 @@ from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,6 +32,15 @@ class DatabaseConfig(BaseSettings):
     echo: bool = False
     pool_size: int = 5
     max_overflow: int = 10
+    # Replace pooled connections older than this many seconds
+    pool_recycle: int = 1800
+    # Test each connection with a round-trip on checkout
+    pool_pre_ping: bool = False
+    # Running behind PgBouncer in transaction mode: let PgBouncer pool
+    # connections and disable asyncpg's prepared statement caches
+    use_pgbouncer: bool = False
+    # Rows per multi-VALUES INSERT statement when inserting many rows at once
+    insertmanyvalues_page_size: int = 1000
 
     @field_validator("url")
     @classmethod
@@ -61,10 +70,27 @@ class Settings(BaseSettings):
     db_url_override: str = (
         ""  # Optional: Override constructed URL (for testing with SQLite)
     )
+    db_echo: bool = False  # Log every SQL statement (debugging only)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = False
+    db_use_pgbouncer: bool = False
+    db_insertmanyvalues_page_size: int = 1000
     jwt_secret_key: str = ""
+    bcrypt_rounds: int = 12  # Each extra round doubles hashing time
     otlp_endpoint: str = ""  # Jaeger OTLP endpoint
+    otlp_max_queue_size: int = 2048  # Spans buffered before new ones drop
+    otlp_schedule_delay_ms: int = 5000
+    otlp_max_export_batch_size: int = 512
+    otlp_export_timeout_ms: int = 30000
+    trace_sample_ratio: float = 1.0  # Share of new traces that are recorded
+    trace_console: bool = False  # Also print spans to stdout (dev only)
     log_level: str = "INFO"
 
+    _jwt_config: JWTConfig | None = PrivateAttr(default=None)
+    _database_config: DatabaseConfig | None = PrivateAttr(default=None)
+
     # tell pydantic where/how to load configuration
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -83,12 +109,28 @@ class Settings(BaseSettings):
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
     def get_jwt_config(self) -> JWTConfig:
-        """Get JWT configuration from settings."""
-        return JWTConfig(secret_key=self.jwt_secret_key)
+        """Get JWT configuration from settings.
+
+        Built and validated once, then reused by every request's TokenService.
+        """
+        if self._jwt_config is None:
+            self._jwt_config = JWTConfig(secret_key=self.jwt_secret_key)
+        return self._jwt_config
 
     def get_database_config(self) -> DatabaseConfig:
         """Get database configuration from settings."""
-        return DatabaseConfig(url=self.db_url)
+        if self._database_config is None:
+            self._database_config = DatabaseConfig(
+                url=self.db_url,
+                echo=self.db_echo,
+                pool_size=self.db_pool_size,
+                max_overflow=self.db_max_overflow,
+                pool_recycle=self.db_pool_recycle,
+                pool_pre_ping=self.db_pool_pre_ping,
+                use_pgbouncer=self.db_use_pgbouncer,
+                insertmanyvalues_page_size=self.db_insertmanyvalues_page_size,
+            )
+        return self._database_config
 
 
 @lru_cache()
@@ -1,12 +1,33 @@
+from functools import lru_cache
+
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import Tracer
 
 from core.settings import get_settings
 
 
+@lru_cache
+def get_tracer(name: str) -> Tracer:
+    """Tracer for a module, resolved once on first use.
+
+    Modules are imported before ``setup_tracing`` installs the provider, so
+    a tracer fetched at import time is a ProxyTracer. It caches the real
+    tracer on its first span once the provider is set, but every span still
+    goes through one extra delegation. Fetched here at span time, it is the
+    SDK tracer itself.
+    """
+    return trace.get_tracer(name)
+
+
 def setup_tracing():
     settings = get_settings()
     otlp_endpoint = settings.otlp_endpoint
@@ -16,10 +37,18 @@ def setup_tracing():
         }
     )
 
-    provider = TracerProvider(resource=resource)
+    # Unsampled spans are non-recording, so their attributes are never built.
+    # Spans with a remote parent follow the caller's sampling decision.
+    provider = TracerProvider(
+        resource=resource,
+        sampler=ParentBased(TraceIdRatioBased(settings.trace_sample_ratio)),
+    )
 
-    # 1️⃣ Always enable console exporter (dev-friendly)
-    provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    # 1️⃣ Console exporter writes synchronously to stdout; opt-in for dev.
+    # Exported inline: a batch queue and worker thread buy nothing for a
+    # local write, unlike for the network exporter below.
+    if settings.trace_console:
+        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
 
     # 2️⃣ Optional OTLP exporter (collector, Tempo, etc.)
     if otlp_endpoint != "":
@@ -31,7 +60,13 @@ def setup_tracing():
                 else f"{otlp_endpoint}/v1/traces"
             )
             provider.add_span_processor(
-                BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint))
+                BatchSpanProcessor(
+                    OTLPSpanExporter(endpoint=endpoint),
+                    max_queue_size=settings.otlp_max_queue_size,
+                    schedule_delay_millis=settings.otlp_schedule_delay_ms,
+                    max_export_batch_size=settings.otlp_max_export_batch_size,
+                    export_timeout_millis=settings.otlp_export_timeout_ms,
+                )
             )
         except Exception as e:
             # Log warning but don't fail - OTLP endpoint might not be available
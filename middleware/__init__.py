@@ -5,10 +5,9 @@ This package contains middleware components for:
 - Prometheus metrics collection
 """
 
-from middleware.correlation import CorrelationIdMiddleware
-from middleware.metrics import PrometheusMetricsMiddleware
+from middleware.observability import ObservabilityMiddleware, bind_route
 
 __all__ = [
-    "CorrelationIdMiddleware",
-    "PrometheusMetricsMiddleware",
+    "ObservabilityMiddleware",
+    "bind_route",
 ]
@@ -0,0 +1,102 @@
+import secrets
+import time
+
+import structlog
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from structlog.contextvars import bind_contextvars, bound_contextvars
+
+from core.metrics import ERROR_COUNT, REQUEST_COUNT, REQUEST_LATENCY, LabelCache
+
+logger = structlog.get_logger()
+
+CORRELATION_HEADER = "X-Correlation-ID"
+# ASGI header names are lowercase bytes
+_CORRELATION_HEADER_KEY = CORRELATION_HEADER.lower().encode("latin-1")
+
+# Path label for requests that matched no route (404s, scanners), so raw
+# URLs never become label values
+UNMATCHED_ROUTE = "unmatched"
+
+
+class ObservabilityMiddleware:
+    """Middleware that tracks correlation IDs and collects Prometheus metrics.
+
+    One pass per request: a single timer, a single send wrapper capturing the
+    status and adding the correlation header, then the completion log line
+    and the metrics. Requests are labelled with the matched route template
+    (``/users/{id}``) rather than the raw path, which keeps label cardinality
+    bounded. Plain ASGI, so no per-request task or stream as with
+    BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._counts = LabelCache(REQUEST_COUNT)
+        self._latencies = LabelCache(REQUEST_LATENCY)
+        self._errors = LabelCache(ERROR_COUNT)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+
+        correlation_id = None
+        for key, value in scope["headers"]:
+            if key == _CORRELATION_HEADER_KEY:
+                correlation_id = value.decode("latin-1")
+                break
+        if not correlation_id:
+            # 32 hex chars; cheaper than formatting a uuid4
+            correlation_id = secrets.token_hex(16)
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message)[CORRELATION_HEADER] = correlation_id
+            await send(message)
+
+        # Bind context for this request; only these keys are reset afterwards
+        with bound_contextvars(
+            correlation_id=correlation_id,
+            path=scope["path"],
+            method=method,
+        ):
+            try:
+                await self.app(scope, receive, send_wrapper)
+
+            finally:
+                duration = time.perf_counter() - start_time
+                # Set by the router once a route has matched
+                route = scope.get("route")
+                path = route.path if route is not None else UNMATCHED_ROUTE
+                # Children are keyed by the int status; prometheus_client
+                # stringifies label values itself when binding.
+                self._counts.get(method, path, status).inc()
+                self._latencies.get(method, path, status).observe(duration)
+                if status >= 500:
+                    self._errors.get(method, path, status).inc()
+
+                logger.info(
+                    "request_completed",
+                    status_code=status,
+                    duration_ms=round(duration * 1000, 2),
+                )
+
+
+async def bind_route(request: Request) -> None:
+    """App-wide dependency binding the matched route template to the log context.
+
+    Routing happens after the middleware has run, so this is the earliest
+    point the template is known. Database metrics read it as their path label.
+    Async so it runs in the request's own context: a sync dependency runs in
+    a worker thread on a copy of the context and the binding would be lost.
+    """
+    bind_contextvars(route=request.scope["route"].path)
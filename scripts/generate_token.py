@@ -10,14 +10,15 @@ Usage:
 
 import argparse
 import sys
+import time
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from jose import jwt
+import jwt
 
 from core.settings import get_settings
 
@@ -34,14 +35,15 @@ def generate_token(
         sys.exit(1)
 
     user_id = str(uuid.uuid4())
-    expiry = datetime.now(timezone.utc) + timedelta(hours=hours)
+    now = int(time.time())
+    exp = now + hours * 3600
 
     payload = {
         "sub": user_id,
         "email": email,
         "role": role,
-        "exp": int(expiry.timestamp()),
-        "iat": int(datetime.now(timezone.utc).timestamp()),
+        "exp": exp,
+        "iat": now,
         "iss": "fastapi-skeleton",
     }
 
@@ -52,6 +54,7 @@ def generate_token(
     print(f"Email:   {email}")
     print(f"Role:    {role}")
     print(f"User ID: {user_id}")
+    expiry = datetime.fromtimestamp(exp, timezone.utc)
     print(f"Expires: {expiry.strftime('%Y-%m-%d %H:%M:%S UTC')}")
     print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     print(f"\nToken:\n{token}\n")
@@ -0,0 +1,13 @@
+"""Fixtures shared by the unit and integration tests."""
+
+import pytest
+import structlog
+
+
+@pytest.fixture(autouse=True, scope="session")
+def uncached_loggers():
+    """Keep structlog loggers unbound so tests can redirect their output.
+
+    A cached logger keeps the sink it was first created with.
+    """
+    structlog.configure(cache_logger_on_first_use=False)
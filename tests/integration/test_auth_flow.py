@@ -0,0 +1,35 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from auth.services.auth import PasswordService, get_password_service
+from core.database import Base, engine
+from main import app
+
+
+@pytest.fixture(scope="module")
+async def client():
+    """Client for the real app over a freshly created schema"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Minimum bcrypt cost; hashing strength is not under test here
+    app.dependency_overrides[get_password_service] = lambda: PasswordService(rounds=4)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        yield client
+    app.dependency_overrides.clear()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+async def test_logged_out_token_is_rejected(client):
+    credentials = {"email": "logout@example.com", "password": "Pass123!"}
+    assert (await client.post("/auth/register", json=credentials)).status_code == 200
+    token = (await client.post("/auth/token", json=credentials)).json()
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+    # Caches the token's owner
+    assert (await client.get("/auth/me", headers=headers)).status_code == 200
+
+    assert (await client.post("/auth/logout", headers=headers)).status_code == 200
+    assert (await client.get("/auth/me", headers=headers)).status_code == 401
@@ -1,3 +1,7 @@
+import io
+
+import pytest
+import structlog
 from fastapi.testclient import TestClient
 
 from main import app
@@ -5,19 +9,44 @@ from main import app
 client = TestClient(app)
 
 
-def test_correlation_id_propagation(caplog):
+@pytest.fixture
+def log_lines():
+    """Capture structlog output; returns a callable listing the lines so far."""
+    buffer = io.BytesIO()
+    config = structlog.get_config()
+    structlog.configure(logger_factory=structlog.BytesLoggerFactory(buffer))
+    yield lambda: buffer.getvalue().decode().splitlines()
+    structlog.configure(**config)
+
+
+def test_correlation_id_propagation(log_lines):
     correlation_id = "test-correlation-id-123"
 
-    with caplog.at_level("INFO"):
-        response = client.get(
-            "/health",
-            headers={"X-Correlation-ID": correlation_id},
-        )
+    response = client.get(
+        "/health",
+        headers={"X-Correlation-ID": correlation_id},
+    )
 
     assert response.status_code == 200
     assert response.headers["X-Correlation-ID"] == correlation_id
 
-    logs = [record.message for record in caplog.records]
+    logs = log_lines()
 
     # At least one log line must contain correlation_id
     assert any(correlation_id in log for log in logs)
+
+
+def test_correlation_id_generated_when_missing():
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["X-Correlation-ID"]
+
+
+def test_route_template_bound_to_log_context(log_lines):
+    client.get("/health")
+
+    completed = [line for line in log_lines() if "request_completed" in line]
+
+    assert completed
+    assert '"route":"/health"' in completed[-1]
@@ -21,7 +21,7 @@ def test_ready_returns_200_when_db_healthy():
 
 
 def test_ready_returns_503_when_db_fails():
-    with patch("main.check_db_readiness", side_effect=ReadinessError("DB error")):
+    with patch("main.cached_db_readiness", side_effect=ReadinessError("DB error")):
         response = client.get("/ready")
         assert response.status_code == 503
         assert response.json() == {"status": "not_ready"}
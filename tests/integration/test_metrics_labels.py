@@ -0,0 +1,16 @@
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_request_metrics_use_route_templates():
+    client.get("/health")
+    client.get("/no/such/path/12345")
+
+    body = client.get("/metrics").text
+
+    assert 'request_count_total{method="GET",path="/health",status_code="200"}' in body
+    assert 'path="unmatched",status_code="404"' in body
+    assert "/no/such/path/12345" not in body
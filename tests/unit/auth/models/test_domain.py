@@ -0,0 +1,19 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from auth.models.domain import CreateTokenDTO, CreateUserDTO
+
+
+def test_create_user_dto_requires_hashed_password():
+    with pytest.raises(ValueError, match="hashed_password is required"):
+        CreateUserDTO(email="user@example.com", hashed_password="")
+
+
+def test_create_token_dto_rejects_past_expiry():
+    with pytest.raises(ValueError, match="must be in the future"):
+        CreateTokenDTO(
+            user_id=uuid.uuid4(),
+            expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+        )
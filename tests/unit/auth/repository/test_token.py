@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from dataclasses import asdict
 from typing import Any, Optional
 from unittest.mock import Mock
 
@@ -26,7 +27,6 @@ def session_execute_returns(
     session_mock._last_execute_result = ExecuteResult(scalars_list, scalar_one)
 
 
-@pytest.mark.asyncio
 async def test_list_returns_dto_list_with_pagination(session_mock):
     repo = TokenRepository(session_mock)
     session_execute_returns(session_mock, scalars=TokenDBFactory.build_batch(10))
@@ -34,14 +34,12 @@ async def test_list_returns_dto_list_with_pagination(session_mock):
     assert len(tokens) == 10
 
 
-@pytest.mark.asyncio
 async def test_list_returns_empty_list_when_no_tokens(session_mock):
     repo = TokenRepository(session_mock)
     tokens = await repo.list(0, 10)
     assert len(tokens) == 0
 
 
-@pytest.mark.asyncio
 async def test_get_existing_returns_dto(session_mock):
     repo = TokenRepository(session_mock)
     token: Token = TokenDBFactory.create()
@@ -50,17 +48,18 @@ async def test_get_existing_returns_dto(session_mock):
     assert token.id == token_from_db.id
 
 
-@pytest.mark.asyncio
 async def test_get_non_existent_raise_error(session_mock):
     repo = TokenRepository(session_mock)
     with pytest.raises(ValueError):
         await repo.get(-1)
 
 
-@pytest.mark.asyncio
 async def test_create_persists_and_returns_dto(session_mock):
     repo = TokenRepository(session_mock)
     create_token_dto = CreateTokenDTOFactory.create()
+    session_execute_returns(
+        session_mock, scalar_one=TokenDBFactory.create(**asdict(create_token_dto))
+    )
     created_dto = await repo.create(create_token_dto)
     # Compare relevant fields (excluding id which is auto-generated)
     assert create_token_dto.user_id == created_dto.user_id
@@ -69,21 +68,29 @@ async def test_create_persists_and_returns_dto(session_mock):
     assert create_token_dto.ip_address == created_dto.ip_address
 
 
-@pytest.mark.asyncio
-async def test_create_calls_session_methods_in_transaction(session_mock):
+async def test_create_uses_single_insert_returning(session_mock):
     repo = TokenRepository(session_mock)
     create_token_dto = CreateTokenDTOFactory.create()
+    session_execute_returns(
+        session_mock, scalar_one=TokenDBFactory.create(**asdict(create_token_dto))
+    )
     await repo.create(create_token_dto)
-    session_mock.add.assert_called_once()
-    session_mock.refresh.assert_awaited()
-    session_mock.refresh.assert_awaited_once()
+    session_mock.execute.assert_awaited_once()
+    session_mock.add.assert_not_called()
+    session_mock.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_update_existing_applies_all_dataclass_fields_to_orm(session_mock):
+async def test_update_existing_returns_updated_dto(session_mock):
     repo = TokenRepository(session_mock)
-    token_db = TokenDBFactory.create()
     token_dto = TokenDTOFactory.create()
+    # Row as handed back by UPDATE ... RETURNING
+    token_db = TokenDBFactory.create(
+        id=token_dto.id,
+        user_id=token_dto.user_id,
+        expires_at=token_dto.expires_at,
+        is_active=False,
+        ip_address=token_dto.ip_address,
+    )
     session_execute_returns(session_mock, scalar_one=token_db)
 
     updated_dto = await repo.update(
@@ -91,51 +98,34 @@ async def test_update_existing_applies_all_dataclass_fields_to_orm(session_mock)
         {
             "user_id": token_dto.user_id,
             "expires_at": token_dto.expires_at,
-            "is_active": token_dto.is_active,
+            "is_active": False,
             "ip_address": token_dto.ip_address,
         },
     )
 
-    # Assert ORM attributes were updated with DTO values
-    assert token_db.user_id == token_dto.user_id
-    assert token_db.expires_at == token_dto.expires_at
-    assert token_db.is_active == token_dto.is_active
-    assert token_db.ip_address == token_dto.ip_address
-
-    # Verify session methods called
-    session_mock.refresh.assert_awaited_once()
-    session_mock.refresh.assert_awaited_once_with(token_db)
+    assert updated_dto.id == token_dto.id
+    assert updated_dto.user_id == token_dto.user_id
+    assert updated_dto.is_active is False
+    # One UPDATE ... RETURNING, no SELECT or refresh
+    session_mock.execute.assert_awaited_once()
+    session_mock.refresh.assert_not_awaited()
 
-    # Verify mapper was used to return DTO
-    assert updated_dto is not None
 
-
-@pytest.mark.asyncio
 async def test_update_only_updates_fields_that_exist_on_orm(session_mock):
     repo = TokenRepository(session_mock)
     token_db = TokenDBFactory.create()
-    token_dto = TokenDTOFactory.create()
-
     session_execute_returns(session_mock, scalar_one=token_db)
 
-    # Repository now checks hasattr before setting fields
-    updated_dto = await repo.update(
-        token_dto.id,
-        {
-            "user_id": token_dto.user_id,
-            "expires_at": token_dto.expires_at,
-            "is_active": token_dto.is_active,
-        },
-    )
+    await repo.update(token_db.id, {"is_active": False, "nickname": "x", "user": None})
 
-    # Verify ORM fields were updated with DTO values
-    assert token_db.user_id == token_dto.user_id
-    assert token_db.expires_at == token_dto.expires_at
-    assert token_db.is_active == token_dto.is_active
-    assert updated_dto is not None
+    stmt = session_mock.execute.await_args.args[0]
+    params = stmt.compile().params
+    assert params["is_active"] is False
+    assert "nickname" not in params
+    # Relationships are attributes on the model but not columns
+    assert "user" not in params
 
 
-@pytest.mark.asyncio
 async def test_update_nonexistent_raises_value_error(session_mock):
     repo = TokenRepository(session_mock)
     token_dto = TokenDTOFactory.create()
@@ -145,7 +135,6 @@ async def test_update_nonexistent_raises_value_error(session_mock):
         await repo.update(token_dto.id, {"is_active": False})
 
 
-@pytest.mark.asyncio
 async def test_delete_existing_deletes_record(session_mock):
     repo = TokenRepository(session_mock)
     token_db = TokenDBFactory.create()
@@ -153,11 +142,12 @@ async def test_delete_existing_deletes_record(session_mock):
 
     await repo.delete(token_db.id)
 
-    # Verify delete was called within transaction
-    session_mock.delete.assert_awaited_once_with(token_db)
+    # One DELETE ... RETURNING, without loading the row first
+    session_mock.execute.assert_awaited_once()
+    assert session_mock.execute.await_args.args[0].is_delete
+    session_mock.delete.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_delete_nonexistent_is_noop(session_mock):
     repo = TokenRepository(session_mock)
     session_execute_returns(session_mock, scalars=[])
@@ -169,7 +159,6 @@ async def test_delete_nonexistent_is_noop(session_mock):
     session_mock.delete.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test__get_returns_single_row_or_raises(session_mock):
     repo = TokenRepository(session_mock)
     token_db = TokenDBFactory.create()
@@ -185,18 +174,18 @@ async def test__get_returns_single_row_or_raises(session_mock):
         await repo._get(999)
 
 
-@pytest.mark.asyncio
 async def test_token_user_relationship_preserved(session_mock):
     """Test that user_id relationship is maintained"""
     repo = TokenRepository(session_mock)
-    token_db = TokenDBFactory.create()
     token_dto = TokenDTOFactory.create()
 
     # Ensure user_id is preserved during operations
     original_user_id = token_dto.user_id
+    token_db = TokenDBFactory.create(id=token_dto.id, user_id=original_user_id)
     session_execute_returns(session_mock, scalar_one=token_db)
 
     updated_dto = await repo.update(token_dto.id, {"user_id": original_user_id})
 
-    assert token_db.user_id == original_user_id
+    stmt = session_mock.execute.await_args.args[0]
+    assert stmt.compile().params["user_id"] == original_user_id
     assert updated_dto.user_id == original_user_id
@@ -1,4 +1,6 @@
+import uuid
 from collections.abc import Iterable
+from dataclasses import asdict
 from typing import Any, Optional
 from unittest.mock import AsyncMock, Mock
 
@@ -26,7 +28,6 @@ def session_execute_returns(
     session_mock._last_execute_result = ExecuteResult(scalars_list, scalar_one)
 
 
-@pytest.mark.asyncio
 async def test_list_returns_dto_list_with_pagination(session_mock):
     repo = UserRepository(session_mock)
     session_execute_returns(session_mock, scalars=UserDBFactory.build_batch(10))
@@ -34,14 +35,38 @@ async def test_list_returns_dto_list_with_pagination(session_mock):
     assert len(users) == 10
 
 
-@pytest.mark.asyncio
 async def test_list_returns_empty_list_when_no_users(session_mock):
     repo = UserRepository(session_mock)
     users = await repo.list(0, 10)
     assert len(users) == 0
 
 
-@pytest.mark.asyncio
+async def test_list_after_seeks_past_cursor(session_mock):
+    repo = UserRepository(session_mock)
+    session_execute_returns(session_mock, scalars=UserDBFactory.build_batch(2))
+    cursor = uuid.uuid4()
+
+    users = await repo.list_after(cursor, 2)
+
+    assert len(users) == 2
+    stmt = session_mock.execute.await_args.args[0]
+    assert stmt.compile().params["id_1"] == cursor
+    assert "OFFSET" not in str(stmt)
+
+
+async def test_list_stream_yields_dtos(session_mock):
+    repo = UserRepository(session_mock)
+    users = UserDBFactory.build_batch(3)
+
+    async def _rows():
+        for user in users:
+            yield user
+
+    session_mock.stream_scalars = AsyncMock(return_value=_rows())
+    streamed = [dto async for dto in repo.list_stream(0, 10)]
+    assert [dto.id for dto in streamed] == [user.id for user in users]
+
+
 async def test_get_existing_returns_dto(session_mock):
     repo = UserRepository(session_mock)
     user: User = UserDBFactory.create()
@@ -50,17 +75,18 @@ async def test_get_existing_returns_dto(session_mock):
     assert user.id == user_from_db.id
 
 
-@pytest.mark.asyncio
 async def test_get_non_existent_raise_error(session_mock):
     repo = UserRepository(session_mock)
     with pytest.raises(ValueError):
         await repo.get("non-existent-uuid")
 
 
-@pytest.mark.asyncio
 async def test_create_persists_and_returns_dto(session_mock):
     repo = UserRepository(session_mock)
     create_user_dto = CreateUserDTOFactory.create()
+    session_execute_returns(
+        session_mock, scalar_one=UserDBFactory.create(**asdict(create_user_dto))
+    )
     created_dto = await repo.create(create_user_dto)
     # Compare relevant fields (excluding id which is auto-generated)
     assert create_user_dto.email == created_dto.email
@@ -68,70 +94,68 @@ async def test_create_persists_and_returns_dto(session_mock):
     assert create_user_dto.role == created_dto.role
 
 
-@pytest.mark.asyncio
-async def test_create_calls_session_methods_in_transaction(session_mock):
+async def test_create_uses_single_insert_returning(session_mock):
     repo = UserRepository(session_mock)
     create_user_dto = CreateUserDTOFactory.create()
+    session_execute_returns(
+        session_mock, scalar_one=UserDBFactory.create(**asdict(create_user_dto))
+    )
     await repo.create(create_user_dto)
-    session_mock.add.assert_called_once()
-    session_mock.refresh.assert_awaited()
-    session_mock.refresh.assert_awaited_once()
+    session_mock.execute.assert_awaited_once()
+    session_mock.add.assert_not_called()
+    session_mock.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_update_existing_applies_all_dataclass_fields_to_orm(session_mock):
+async def test_create_many_issues_single_insert(session_mock):
+    repo = UserRepository(session_mock)
+    session_execute_returns(session_mock, scalars=UserDBFactory.build_batch(3))
+    created = await repo.create_many(CreateUserDTOFactory.build_batch(3))
+    assert len(created) == 3
+    session_mock.execute.assert_awaited_once()
+    assert len(session_mock.execute.await_args.args[1]) == 3
+
+
+async def test_create_many_with_no_records_skips_database(session_mock):
+    repo = UserRepository(session_mock)
+    assert await repo.create_many([]) == []
+    session_mock.execute.assert_not_awaited()
+
+
+async def test_update_existing_returns_updated_dto(session_mock):
     repo = UserRepository(session_mock)
-    user_db = UserDBFactory.create()
     user_dto = UserDTOFactory.create()
+    # Row as handed back by UPDATE ... RETURNING
+    user_db = UserDBFactory.create(
+        id=user_dto.id, email=user_dto.email, is_active=False, role=user_dto.role
+    )
     session_execute_returns(session_mock, scalar_one=user_db)
 
     updated_dto = await repo.update(
         user_dto.id,
-        {
-            "email": user_dto.email,
-            "is_active": user_dto.is_active,
-            "role": user_dto.role,
-        },
+        {"email": user_dto.email, "is_active": False, "role": user_dto.role},
     )
 
-    # Assert ORM attributes were updated with DTO values
-    assert user_db.email == user_dto.email
-    assert user_db.is_active == user_dto.is_active
-    assert user_db.role == user_dto.role
-
-    # Verify session methods called
-    session_mock.refresh.assert_awaited_once()
+    assert updated_dto.id == user_dto.id
+    assert updated_dto.email == user_dto.email
+    assert updated_dto.is_active is False
+    # One UPDATE ... RETURNING, no SELECT or refresh
+    session_mock.execute.assert_awaited_once()
+    session_mock.refresh.assert_not_awaited()
 
-    # Verify mapper was used to return DTO
-    assert updated_dto is not None
 
-
-@pytest.mark.asyncio
 async def test_update_only_updates_fields_that_exist_on_orm(session_mock):
     repo = UserRepository(session_mock)
     user_db = UserDBFactory.create()
-    user_dto = UserDTOFactory.create()
-
     session_execute_returns(session_mock, scalar_one=user_db)
 
-    # Repository now checks hasattr before setting fields
-    updated_dto = await repo.update(
-        user_dto.id,
-        {
-            "email": user_dto.email,
-            "is_active": user_dto.is_active,
-            "role": user_dto.role,
-        },
-    )
+    await repo.update(user_db.id, {"is_active": False, "nickname": "x"})
 
-    # Verify ORM fields were updated with DTO values
-    assert user_db.email == user_dto.email
-    assert user_db.is_active == user_dto.is_active
-    assert user_db.role == user_dto.role
-    assert updated_dto is not None
+    stmt = session_mock.execute.await_args.args[0]
+    params = stmt.compile().params
+    assert params["is_active"] is False
+    assert "nickname" not in params
 
 
-@pytest.mark.asyncio
 async def test_update_nonexistent_raises_value_error(session_mock):
     repo = UserRepository(session_mock)
     user_dto = UserDTOFactory.create()
@@ -141,7 +165,6 @@ async def test_update_nonexistent_raises_value_error(session_mock):
         await repo.update(user_dto.id, {"is_active": False})
 
 
-@pytest.mark.asyncio
 async def test_delete_existing_deletes_record(session_mock):
     repo = UserRepository(session_mock)
     user_db = UserDBFactory.create()
@@ -149,11 +172,12 @@ async def test_delete_existing_deletes_record(session_mock):
 
     await repo.delete(user_db.id)
 
-    # Verify delete was called within transaction
-    session_mock.delete.assert_awaited_once_with(user_db)
+    # One DELETE ... RETURNING, without loading the row first
+    session_mock.execute.assert_awaited_once()
+    assert session_mock.execute.await_args.args[0].is_delete
+    session_mock.delete.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_delete_nonexistent_is_noop(session_mock):
     repo = UserRepository(session_mock)
     session_execute_returns(session_mock, scalars=[])
@@ -165,7 +189,6 @@ async def test_delete_nonexistent_is_noop(session_mock):
     session_mock.delete.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test__get_returns_single_row_or_raises(session_mock):
     repo = UserRepository(session_mock)
     user_db = UserDBFactory.create()
@@ -181,15 +204,14 @@ async def test__get_returns_single_row_or_raises(session_mock):
         await repo._get("non-existent-uuid")
 
 
-@pytest.mark.asyncio
 async def test_get_by_email_returns_user_when_exists(session_mock):
     """Test get_by_email returns UserDTO when user exists"""
     repo = UserRepository(session_mock)
     user_db = UserDBFactory.create(email="exists@example.com")
 
-    # Mock the result to have scalar_one_or_none method
+    # Mock the result to have one_or_none method
     result_mock = Mock()
-    result_mock.scalar_one_or_none.return_value = user_db
+    result_mock.one_or_none.return_value = user_db
     session_mock.execute = AsyncMock(return_value=result_mock)
 
     result = await repo.get_by_email("exists@example.com")
@@ -199,16 +221,95 @@ async def test_get_by_email_returns_user_when_exists(session_mock):
     assert result.id == user_db.id
 
 
-@pytest.mark.asyncio
 async def test_get_by_email_returns_none_when_not_exists(session_mock):
     """Test get_by_email returns None when user doesn't exist"""
     repo = UserRepository(session_mock)
 
     # Mock the result to return None
     result_mock = Mock()
-    result_mock.scalar_one_or_none.return_value = None
+    result_mock.one_or_none.return_value = None
     session_mock.execute = AsyncMock(return_value=result_mock)
 
     result = await repo.get_by_email("notfound@example.com")
 
     assert result is None
+
+
+async def test_get_by_email_always_queries(session_mock):
+    """Login reads the current row, never a cached copy of the password hash"""
+    repo = UserRepository(session_mock)
+    user_db = UserDBFactory.create(email="cached@example.com")
+    result_mock = Mock()
+    result_mock.one_or_none.return_value = user_db
+    session_mock.execute = AsyncMock(return_value=result_mock)
+
+    await repo.is_email_registered("cached@example.com")
+    await repo.get_by_email("cached@example.com")
+
+    assert session_mock.execute.await_count == 2
+
+
+async def test_is_email_registered_serves_repeat_lookups_from_cache(session_mock):
+    repo = UserRepository(session_mock)
+    user_db = UserDBFactory.create(email="cached@example.com")
+    result_mock = Mock()
+    result_mock.one_or_none.return_value = user_db
+    session_mock.execute = AsyncMock(return_value=result_mock)
+
+    assert await repo.is_email_registered("cached@example.com")
+    assert await repo.is_email_registered("Cached@Example.com")
+
+    session_mock.execute.assert_awaited_once()
+
+
+async def test_is_email_registered_does_not_cache_misses(session_mock):
+    repo = UserRepository(session_mock)
+    result_mock = Mock()
+    result_mock.one_or_none.return_value = None
+    session_mock.execute = AsyncMock(return_value=result_mock)
+
+    assert not await repo.is_email_registered("new@example.com")
+    assert not await repo.is_email_registered("new@example.com")
+
+    assert session_mock.execute.await_count == 2
+
+
+async def test_update_invalidates_registered_email_cache_on_commit(session_mock):
+    repo = UserRepository(session_mock)
+    user_db = UserDBFactory.create(email="cached@example.com")
+    result_mock = Mock()
+    result_mock.one_or_none.return_value = user_db
+    result_mock.scalar_one.return_value = user_db
+    session_mock.execute = AsyncMock(return_value=result_mock)
+
+    await repo.is_email_registered("cached@example.com")
+    await repo.update(user_db.id, {"is_active": False})
+    # Not evicted before the commit: a reader would only re-cache the old row
+    await repo.is_email_registered("cached@example.com")
+    assert session_mock.execute.await_count == 2
+
+    await session_mock.commit()
+    await repo.is_email_registered("cached@example.com")
+
+    # lookup, update's fetch, lookup again after invalidation
+    assert session_mock.execute.await_count == 3
+
+
+async def test_get_active_by_token_id_returns_token_owner(session_mock):
+    repo = UserRepository(session_mock)
+    user_db = UserDBFactory.create()
+    result_mock = Mock()
+    result_mock.one_or_none.return_value = user_db
+    session_mock.execute = AsyncMock(return_value=result_mock)
+
+    result = await repo.get_active_by_token_id(str(uuid.uuid4()))
+
+    assert result is not None
+    assert result.id == user_db.id
+    session_mock.execute.assert_awaited_once()
+
+
+async def test_get_active_by_token_id_rejects_malformed_id(session_mock):
+    repo = UserRepository(session_mock)
+    assert await repo.get_active_by_token_id("not-a-uuid") is None
+    session_mock.execute.assert_not_awaited()
@@ -4,47 +4,83 @@ from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from auth.models.enums import UserRole
 from auth.models.schemas import TokenOut, UserOut
 from auth.routers.auth import router
-from auth.services.auth import AuthService, get_auth_service, get_current_user_service
+from auth.services.auth import get_auth_service, get_current_user_service
+
+# Response models are built once; the router only serializes them
+_NOW = datetime.now(timezone.utc)
+NEW_USER = UserOut(
+    id=uuid.uuid4(),
+    email="new@example.com",
+    is_active=True,
+    role=UserRole.VIEWER,
+    created_at=_NOW,
+    updated_at=_NOW,
+)
+CURRENT_USER = UserOut(
+    id=uuid.uuid4(),
+    email="current@example.com",
+    is_active=True,
+    role=UserRole.MEMBER,
+    created_at=_NOW,
+    updated_at=_NOW,
+)
+LOGIN_TOKEN = TokenOut(access_token="jwt_abc123")
+
+
+class StubAuthService:
+    """AuthService stand-in exposing the methods the router awaits.
+
+    Cheaper to build than AsyncMock(spec=AuthService), which introspects
+    every method signature of the class.
+    """
+
+    def __init__(self):
+        self.register_user = AsyncMock()
+        self.authenticate_user = AsyncMock()
+        self.logout = AsyncMock()
 
 
 @pytest.fixture
 def mock_auth_service():
-    """Mock AuthService"""
-    return AsyncMock(spec=AuthService)
+    """Stubbed AuthService"""
+    return StubAuthService()
 
 
-@pytest.fixture
-def app(mock_auth_service):
-    """Create test app with dependency overrides"""
+@pytest.fixture(scope="module")
+def base_app():
+    """Test app, built once per module"""
     app = FastAPI()
     app.include_router(router)
-    app.dependency_overrides[get_auth_service] = lambda: mock_auth_service
-    yield app
-    app.dependency_overrides.clear()
+    return app
+
+
+@pytest.fixture
+def app(base_app, mock_auth_service):
+    """Shared test app with this test's dependency overrides"""
+    base_app.dependency_overrides[get_auth_service] = lambda: mock_auth_service
+    yield base_app
+    base_app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def client(app):
-    return TestClient(app)
+async def client(app):
+    """Client calling the app in-process, without a portal thread"""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        yield client
 
 
-def test_register_user_success(client, mock_auth_service):
+async def test_register_user_success(client, mock_auth_service):
     """Test POST /auth/register creates new user"""
-    mock_auth_service.register_user.return_value = UserOut(
-        id=uuid.uuid4(),
-        email="new@example.com",
-        is_active=True,
-        role=UserRole.VIEWER,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
-    )
+    mock_auth_service.register_user.return_value = NEW_USER
 
-    response = client.post(
+    response = await client.post(
         "/auth/register", json={"email": "new@example.com", "password": "Pass123!"}
     )
 
@@ -52,13 +88,11 @@ def test_register_user_success(client, mock_auth_service):
     assert response.json()["email"] == "new@example.com"
 
 
-def test_login_success(client, mock_auth_service):
+async def test_login_success(client, mock_auth_service):
     """Test POST /auth/token returns JWT"""
-    mock_auth_service.authenticate_user.return_value = TokenOut(
-        access_token="jwt_abc123"
-    )
+    mock_auth_service.authenticate_user.return_value = LOGIN_TOKEN
 
-    response = client.post(
+    response = await client.post(
         "/auth/token", json={"email": "user@example.com", "password": "pass123"}
     )
 
@@ -68,20 +102,11 @@ def test_login_success(client, mock_auth_service):
     assert data["token_type"] == "bearer"
 
 
-def test_get_me_returns_current_user(client, app):
+async def test_get_me_returns_current_user(client, app):
     """Test GET /auth/me returns authenticated user"""
-    mock_user = UserOut(
-        id=uuid.uuid4(),
-        email="current@example.com",
-        is_active=True,
-        role=UserRole.MEMBER,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
-    )
-
-    app.dependency_overrides[get_current_user_service] = lambda: mock_user
+    app.dependency_overrides[get_current_user_service] = lambda: CURRENT_USER
 
-    response = client.get("/auth/me")
+    response = await client.get("/auth/me")
 
     assert response.status_code == 200
     assert response.json()["email"] == "current@example.com"
@@ -0,0 +1,29 @@
+from unittest.mock import Mock
+
+import pytest
+
+from auth.services.auth import PasswordService, get_password_service
+
+
+@pytest.fixture
+def password_service():
+    # Minimum cost keeps the tests fast
+    return PasswordService(rounds=4)
+
+
+async def test_hash_verifies_against_original_password(password_service):
+    hashed = await password_service.get_password_hash("s3cret!")
+    assert hashed.startswith("$2b$04$")
+    assert await password_service.verify_password("s3cret!", hashed)
+
+
+async def test_verify_rejects_wrong_password(password_service):
+    hashed = await password_service.get_password_hash("s3cret!")
+    assert not await password_service.verify_password("wrong1!", hashed)
+
+
+def test_dependency_reuses_one_service_per_cost_factor():
+    settings = Mock(bcrypt_rounds=4)
+    service = get_password_service(settings)
+    assert get_password_service(settings) is service
+    assert service.rounds == 4
@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from auth.models.db import Token
+from auth.services.token_cleanup import TokenCleanupService
+
+
+@pytest.fixture
+def cleanup_service():
+    # Small batches so a few fake results cover several rounds
+    return TokenCleanupService(batch_size=2)
+
+
+def probe_result(found: bool) -> Mock:
+    """Result of the SELECT 1 ... LIMIT 1 probe"""
+    return Mock(first=Mock(return_value=(1,) if found else None))
+
+
+def delete_result(rowcount: int) -> Mock:
+    """Result of one batched DELETE"""
+    return Mock(rowcount=rowcount)
+
+
+async def delete_expired(cleanup_service, session_mock):
+    return await cleanup_service._delete_in_batches(
+        session_mock, Token.expires_at < datetime.now(timezone.utc), Token.expires_at
+    )
+
+
+async def test_delete_in_batches_commits_once_per_batch(cleanup_service, session_mock):
+    session_mock.execute = AsyncMock(
+        side_effect=[
+            probe_result(True),
+            delete_result(2),
+            delete_result(2),
+            delete_result(1),
+        ]
+    )
+
+    deleted = await delete_expired(cleanup_service, session_mock)
+
+    assert deleted == 5
+    assert session_mock.commit.await_count == 3
+
+
+async def test_delete_in_batches_stops_on_short_batch(cleanup_service, session_mock):
+    session_mock.execute = AsyncMock(
+        side_effect=[probe_result(True), delete_result(1), delete_result(2)]
+    )
+
+    deleted = await delete_expired(cleanup_service, session_mock)
+
+    # The short first batch ends the loop; the second result is never used
+    assert deleted == 1
+    assert session_mock.execute.await_count == 2
+    session_mock.commit.assert_awaited_once()
+
+
+async def test_delete_in_batches_only_probes_when_nothing_matches(
+    cleanup_service, session_mock
+):
+    session_mock.execute = AsyncMock(return_value=probe_result(False))
+
+    deleted = await delete_expired(cleanup_service, session_mock)
+
+    assert deleted == 0
+    session_mock.execute.assert_awaited_once()
+    session_mock.commit.assert_not_awaited()
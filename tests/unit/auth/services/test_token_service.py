@@ -3,13 +3,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from unittest.mock import Mock
 
+import jwt
 import pytest
-from jose import jwt
+from fastapi import HTTPException
 
-from auth.repositories.auth import TokenRepository
+from auth.repositories.auth import TokenRepository, _users_by_token
 from auth.services.auth import TokenService
-from tests.unit.conftest import ExecuteResult
-from tests.unit.factories import UserDTOFactory
+from tests.unit.conftest import ExecuteResult, make_session_mock
+from tests.unit.factories import TokenDBFactory, make_user_dto
 
 
 def session_execute_returns(
@@ -31,57 +32,61 @@ def session_execute_returns(
 def token_service(session_mock, jwt_config):
     """Fixture to create TokenService with mocked dependencies."""
     token_repository = TokenRepository(session_mock)
+    # Row handed back by the INSERT ... RETURNING in TokenRepository.create
+    session_execute_returns(session_mock, scalar_one=TokenDBFactory.create())
     return TokenService(token_repository, jwt_config)
 
 
-@pytest.mark.asyncio
-async def test_create_access_token_with_default_expiry(token_service):
-    """Test creating access token with default expiry time"""
-    user_dto = UserDTOFactory.create()
+@pytest.fixture(scope="module")
+async def default_token(jwt_config):
+    """One token with the default expiry, shared by read-only assertions."""
+    session_mock = make_session_mock()
+    session_execute_returns(session_mock, scalar_one=TokenDBFactory.create())
+    token_service = TokenService(TokenRepository(session_mock), jwt_config)
+    return await token_service.create_access_token(make_user_dto())
 
-    token = await token_service.create_access_token(user_dto)
 
+def test_create_access_token_with_default_expiry(default_token, jwt_config):
+    """Test creating access token with default expiry time"""
     # Verify it returns a valid JWT that can be decoded
-    assert isinstance(token, str)
+    assert isinstance(default_token, str)
     decoded = jwt.decode(
-        token, token_service.secret_key, algorithms=[token_service.algorithm]
+        default_token, jwt_config.secret_key, algorithms=[jwt_config.algorithm]
     )
     assert "exp" in decoded
 
 
-@pytest.mark.asyncio
 async def test_create_access_token_with_custom_expiry(token_service):
     """Test creating access token with custom expiry time"""
-    user_dto = UserDTOFactory.create()
+    user_dto = make_user_dto()
     custom_expiry = timedelta(hours=2)
 
     token = await token_service.create_access_token(user_dto, custom_expiry)
 
     # Verify custom expiry was used
     decoded = jwt.decode(
-        token, token_service.secret_key, algorithms=[token_service.algorithm]
+        token,
+        token_service.jwt_config.secret_key,
+        algorithms=[token_service.jwt_config.algorithm],
     )
     exp_time = datetime.fromtimestamp(decoded["exp"], timezone.utc)
     expected_exp = datetime.now(timezone.utc) + custom_expiry
     assert abs((exp_time - expected_exp).total_seconds()) < 5
 
 
-@pytest.mark.asyncio
 async def test_create_access_token_calls_repository_create(token_service, session_mock):
     """Test that create_access_token properly calls the repository create method"""
-    user_dto = UserDTOFactory.create()
+    user_dto = make_user_dto()
 
     await token_service.create_access_token(user_dto)
 
-    # Verify session methods were called (indicating repository.create was called)
-    session_mock.add.assert_called_once()
-    session_mock.refresh.assert_awaited_once()
+    # Verify the token row was inserted (indicating repository.create was called)
+    session_mock.execute.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_create_access_token_preserves_original_data(token_service):
     """Test that original data dictionary is not modified"""
-    user_dto = UserDTOFactory.create()
+    user_dto = make_user_dto()
     id = user_dto.id
     email = user_dto.email
 
@@ -92,15 +97,124 @@ async def test_create_access_token_preserves_original_data(token_service):
     assert email == user_dto.email
 
 
-@pytest.mark.asyncio
-async def test_create_access_token_uses_correct_algorithm_and_issuer(token_service):
+def test_create_access_token_uses_correct_algorithm_and_issuer(
+    default_token, jwt_config
+):
     """Test that JWT uses correct algorithm and issuer"""
-    user_dto = UserDTOFactory.create()
-
-    token = await token_service.create_access_token(user_dto)
-
     # Verify correct issuer and algorithm
     decoded = jwt.decode(
-        token, token_service.secret_key, algorithms=[token_service.algorithm]
+        default_token, jwt_config.secret_key, algorithms=[jwt_config.algorithm]
     )
     assert decoded["iss"] == "fastapi-skeleton"
+
+
+async def test_deactivate_forgets_token_owner_on_commit(token_service, session_mock):
+    """The cached owner is only dropped once the deactivation is committed"""
+    token_db = TokenDBFactory.create()
+    token_id = str(token_db.id)
+    _users_by_token.set(token_id, make_user_dto())
+    # Row as handed back by the deactivating UPDATE ... RETURNING
+    session_execute_returns(
+        session_mock, scalar_one=TokenDBFactory.create(id=token_db.id, is_active=False)
+    )
+
+    await token_service.deactivate(token_id)
+    assert _users_by_token.get(token_id) is not None
+
+    await session_mock.commit()
+    assert _users_by_token.get(token_id) is None
+
+
+def test_decode_rejects_foreign_issuer(token_service):
+    """Tokens signed with our key but another issuer are refused"""
+    token = jwt.encode(
+        {"sub": "x", "iss": "someone-else", "exp": 4102444800},
+        token_service.jwt_config.secret_key,
+        algorithm=token_service.jwt_config.algorithm,
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        token_service.decode(token)
+    assert exc_info.value.status_code == 401
+
+
+def test_hs256_fast_path_matches_pyjwt(token_service):
+    """The hand-assembled HS256 token is byte-identical to PyJWT's"""
+    payload = {"id": "user", "exp": 4102444800, "iss": "fastapi-skeleton", "sub": "t"}
+    expected = jwt.encode(
+        payload,
+        token_service.jwt_config.secret_key,
+        algorithm=token_service.jwt_config.algorithm,
+    )
+    assert token_service.signer.encode(payload) == expected
+
+
+def test_decode_rejects_expired_token(token_service):
+    """Expired tokens are refused on the HS256 fast path"""
+    token = token_service.signer.encode(
+        {"sub": "t", "iss": "fastapi-skeleton", "exp": 946684800}
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        token_service.decode(token)
+    assert exc_info.value.status_code == 401
+
+
+def test_decode_rejects_tampered_signature(token_service):
+    """A token whose signature does not match its contents is refused"""
+    token = token_service.signer.encode(
+        {"sub": "t", "iss": "fastapi-skeleton", "exp": 4102444800}
+    )
+    header, _, signature = token.split(".")
+    forged = token_service.signer.encode(
+        {"sub": "other", "iss": "fastapi-skeleton", "exp": 4102444800}
+    ).split(".")[1]
+    with pytest.raises(HTTPException) as exc_info:
+        token_service.decode(f"{header}.{forged}.{signature}")
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"aud": "someone"},
+        {"iat": 4102444800},
+        {"iat": "yesterday"},
+        {"jti": 5},
+    ],
+    ids=["audience", "future-iat", "non-numeric-iat", "non-string-jti"],
+)
+def test_fast_path_rejects_what_pyjwt_rejects(token_service, claims):
+    """Validly signed tokens PyJWT refuses are refused on the fast path too"""
+    config = token_service.jwt_config
+    token = token_service.signer.encode(
+        {"sub": "t", "iss": "fastapi-skeleton", "exp": 4102444800, **claims}
+    )
+    with pytest.raises(jwt.InvalidTokenError):
+        jwt.decode(
+            token,
+            config.secret_key,
+            algorithms=[config.algorithm],
+            issuer="fastapi-skeleton",
+        )
+    with pytest.raises(HTTPException) as exc_info:
+        token_service.decode(token)
+    assert exc_info.value.status_code == 401
+
+
+def test_fast_path_accepts_past_iat_and_string_jti(token_service):
+    token = token_service.signer.encode(
+        {
+            "sub": "t",
+            "iss": "fastapi-skeleton",
+            "exp": 4102444800,
+            "iat": 946684800,
+            "jti": "abc",
+        }
+    )
+    assert token_service.decode(token)["jti"] == "abc"
+
+
+def test_token_services_share_one_signer_per_key(session_mock, jwt_config):
+    """Per-request services reuse the signer instead of re-keying it"""
+    first = TokenService(TokenRepository(session_mock), jwt_config)
+    second = TokenService(TokenRepository(session_mock), jwt_config)
+    assert first.signer is second.signer
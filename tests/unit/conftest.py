@@ -8,15 +8,18 @@ from typing import Any, List, Optional
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from sqlalchemy.exc import NoResultFound
 
-from auth.repositories.auth import TokenRepository, UserRepository
-from auth.services.auth import PasswordService, TokenService
+from auth.repositories.auth import clear_user_caches
+from core.database import _drop_post_commit, _run_post_commit
 from core.settings import JWTConfig
 
 
 class AsyncCtxMgr:
     """Simple async context manager used for `async with session.begin():`"""
 
+    __slots__ = ()
+
     async def __aenter__(self):
         return self
 
@@ -24,6 +27,18 @@ class AsyncCtxMgr:
         return False
 
 
+class _Scalars:
+    """What ``result.scalars()`` returns; ``.all()`` is sync in SQLAlchemy."""
+
+    __slots__ = ("_lst",)
+
+    def __init__(self, lst):
+        self._lst = lst
+
+    def all(self):
+        return self._lst
+
+
 class ExecuteResult:
     """
     Lightweight mimic of SQLAlchemy result for tests.
@@ -32,20 +47,13 @@ class ExecuteResult:
     - .scalar_one_or_none() -> item or None
     """
 
+    __slots__ = ("_scalars_list", "_scalar_single", "_scalars")
+
     def __init__(
         self, scalars_list: Optional[List[Any]] = None, scalar_single: Any = None
     ):
         self._scalars_list = list(scalars_list or [])
         self._scalar_single = scalar_single
-
-        # scalars() returns object with .all() (sync) in SQLAlchemy; we mimic that
-        class _Scalars:
-            def __init__(self, lst):
-                self._lst = lst
-
-            def all(self):
-                return self._lst
-
         self._scalars = _Scalars(self._scalars_list)
 
     def scalars(self):
@@ -58,8 +66,6 @@ class ExecuteResult:
         if self._scalars_list:
             return self._scalars_list[0]
         # raise same exception SQLAlchemy raises for no result
-        from sqlalchemy.exc import NoResultFound
-
         raise NoResultFound("No row found for query")
 
     def scalar_one_or_none(self):
@@ -71,40 +77,60 @@ class ExecuteResult:
         return None
 
 
-def make_session_mock() -> Mock:
-    """
-    Return a Mock that behaves like sqlalchemy.ext.asyncio.AsyncSession for tests.
-    - session.execute is AsyncMock returning ExecuteResult
-    - session.begin() returns an async context manager object
-    - commit/rollback/flush/refresh/delete are AsyncMock (awaitable)
-    - add is regular Mock (add is sync in SQLAlchemy)
+class FakeAsyncSession:
+    """Stand-in for sqlalchemy.ext.asyncio.AsyncSession in tests.
+
+    A plain object rather than a Mock: only the session methods carry mock
+    machinery (so calls can be asserted), and touching anything else raises
+    AttributeError instead of silently returning a new child mock.
+    - execute is an AsyncMock returning the stored ExecuteResult
+    - begin() returns an async context manager object
+    - commit/rollback/flush/refresh/delete are AsyncMock (awaitable);
+      commit runs the on_commit callbacks, rollback drops them
+    - add is a regular Mock (add is sync in SQLAlchemy)
     """
-    session = Mock(name="AsyncSessionMock")
 
-    # Async methods
-    session.execute = AsyncMock(name="execute")
-    session.flush = AsyncMock(name="flush")
-    session.refresh = AsyncMock(name="refresh")
-    session.delete = AsyncMock(name="delete")
-    session.commit = AsyncMock(name="commit")
-    session.rollback = AsyncMock(name="rollback")
+    def __init__(self):
+        # store a default execute result that tests can replace
+        self._last_execute_result = ExecuteResult([])
+        self.info: dict[str, Any] = {}
 
-    # add is sync in SQLAlchemy; keep as Mock
-    session.add = Mock(name="add")
+        # Async methods
+        self.execute = AsyncMock(name="execute", side_effect=self._execute)
+        self.flush = AsyncMock(name="flush")
+        self.refresh = AsyncMock(name="refresh")
+        self.delete = AsyncMock(name="delete")
+        self.commit = AsyncMock(name="commit", side_effect=self._commit)
+        self.rollback = AsyncMock(name="rollback", side_effect=self._rollback)
 
-    # store a default execute result that tests can replace
-    session._last_execute_result = ExecuteResult([])
+        # add is sync in SQLAlchemy; keep as Mock
+        self.add = Mock(name="add")
 
-    async def _execute_side_effect(*args, **kwargs):
+        # begin() should return an async context manager
+        self.begin = Mock(name="begin", return_value=AsyncCtxMgr())
+
+    async def _execute(self, *args, **kwargs):
         # always return the stored ExecuteResult (synchronous object)
-        return session._last_execute_result
+        return self._last_execute_result
+
+    async def _commit(self):
+        _run_post_commit(self)
+
+    async def _rollback(self):
+        _drop_post_commit(self)
+
 
-    session.execute.side_effect = _execute_side_effect
+def make_session_mock() -> FakeAsyncSession:
+    """Return a FakeAsyncSession that behaves like AsyncSession for tests."""
+    return FakeAsyncSession()
 
-    # begin() should return an async context manager
-    session.begin = Mock(name="begin", return_value=AsyncCtxMgr())
 
-    return session
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Keep cached lookups from leaking between tests."""
+    clear_user_caches()
+    yield
+    clear_user_caches()
 
 
 @pytest.fixture
@@ -115,31 +141,22 @@ def session_mock():
 
 @pytest.fixture
 def mock_password_service():
-    """Provides a mocked PasswordService."""
-    return AsyncMock(spec=PasswordService)
+    """Provides a mocked PasswordService.
 
-
-@pytest.fixture
-def mock_token_service():
-    """Provides a mocked TokenService."""
-    return AsyncMock(spec=TokenService)
-
-
-@pytest.fixture
-def mock_user_repository(session_mock):
-    """Provides a mocked UserRepository."""
-    return Mock(spec=UserRepository)
+    No spec: AsyncMock(spec=...) introspects every method of the class.
+    """
+    return AsyncMock()
 
 
 @pytest.fixture
-def mock_token_repository(session_mock):
-    """Provides a mocked TokenRepository."""
-    return Mock(spec=TokenRepository)
+def mock_token_service():
+    """Provides a mocked TokenService, without a spec for the same reason."""
+    return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def jwt_config():
-    """Provides a test JWT configuration."""
+    """Provides a test JWT configuration, shared since no test modifies it."""
     return JWTConfig(
         secret_key="test-secret-key-with-at-least-32-characters-for-security",
         algorithm="HS256",
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from auth.models.db import User
+from auth.models.mappers import UserMapper
+from tests.unit.factories import CreateUserDTOFactory, UserDBFactory
+
+
+@dataclass(frozen=True)
+class UpdateUserDTO:
+    email: Optional[str] = None
+    is_active: Optional[bool] = None
+    nickname: Optional[str] = None
+
+
+def test_to_insert_values_drops_none_fields():
+    dto = CreateUserDTOFactory.build(role=None)
+    values = UserMapper.to_insert_values(dto)
+    assert "role" not in values
+    assert values["email"] == dto.email
+
+
+def test_apply_update_sets_only_known_non_none_fields():
+    user = UserDBFactory.build(is_active=True)
+    email = user.email
+    UserMapper.apply_update(user, UpdateUserDTO(is_active=False, nickname="x"))
+    assert user.is_active is False
+    assert user.email == email
+    assert not hasattr(user, "nickname")
+
+
+def test_mapper_rejects_non_dataclass_dtos():
+    with pytest.raises(TypeError):
+        UserMapper.to_insert_values(User(email="a@b.co"))
+    with pytest.raises(TypeError):
+        UserMapper.apply_update(User(), {"is_active": False})
+
+
+def test_from_db_batch_matches_from_db():
+    users = UserDBFactory.build_batch(3)
+    assert UserMapper.from_db_batch(users) == [UserMapper.from_db(u) for u in users]
@@ -0,0 +1,20 @@
+import ipaddress
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from core.db.types import IPAddress
+
+
+def test_ip_address_uses_inet_only_on_postgresql():
+    column_type = IPAddress()
+    pg_impl = column_type.load_dialect_impl(postgresql.dialect())
+    sqlite_impl = column_type.load_dialect_impl(sqlite.dialect())
+    assert isinstance(pg_impl, postgresql.INET)
+    assert not isinstance(sqlite_impl, postgresql.INET)
+
+
+def test_ip_address_returns_driver_objects_as_strings():
+    value = IPAddress().process_result_value(
+        ipaddress.ip_address("2001:db8::1"), postgresql.dialect()
+    )
+    assert value == "2001:db8::1"
@@ -0,0 +1,23 @@
+from unittest.mock import patch
+
+from core.cache import TTLCache
+
+
+def test_get_returns_value_until_ttl_expires():
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=30)
+    with patch("core.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+    with patch("core.cache.time.monotonic", return_value=131.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_set_evicts_oldest_entry_when_full():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
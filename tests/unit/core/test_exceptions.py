@@ -0,0 +1,25 @@
+from core.exceptions import (
+    DomainException,
+    ResourceNotFoundException,
+    TokenExpiredException,
+    domain_exception_to_http,
+)
+
+
+def test_auth_failures_carry_bearer_challenge():
+    http_exc = domain_exception_to_http(TokenExpiredException(), "abc")
+    assert http_exc.status_code == 401
+    assert http_exc.headers == {
+        "WWW-Authenticate": "Bearer",
+        "X-Correlation-ID": "abc",
+    }
+
+
+def test_status_follows_exception_type():
+    assert (
+        domain_exception_to_http(ResourceNotFoundException("User", 1)).status_code
+        == 404
+    )
+    http_exc = domain_exception_to_http(DomainException("boom"))
+    assert http_exc.status_code == 500
+    assert http_exc.headers is None
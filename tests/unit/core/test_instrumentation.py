@@ -0,0 +1,18 @@
+import pytest
+
+from core.instrumentation import get_operation
+
+
+@pytest.mark.parametrize(
+    ("sql", "operation"),
+    [
+        ("SELECT users.id FROM users", "select"),
+        ("\n  insert INTO tokens VALUES (1)", "insert"),
+        ("Update users SET is_active = false", "update"),
+        ("DELETE FROM tokens", "delete"),
+        ("WITH t AS (SELECT 1) SELECT * FROM t", "other"),
+        ("", "other"),
+    ],
+)
+def test_get_operation_reads_leading_keyword(sql, operation):
+    assert get_operation(sql) == operation
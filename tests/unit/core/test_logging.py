@@ -0,0 +1,109 @@
+import io
+import logging
+import threading
+from logging.handlers import QueueHandler
+
+import pytest
+import structlog
+
+from core.logging import QueuedWriter, setup_logging, shutdown_logging
+
+
+def test_queued_writer_flushes_queued_lines_on_stop():
+    stream = io.BytesIO()
+    writer = QueuedWriter(stream)
+    writer.start()
+
+    for i in range(100):
+        writer.write(b"line %d\n" % i)
+    writer.stop()
+
+    assert stream.getvalue().splitlines() == [b"line %d" % i for i in range(100)]
+
+
+def test_queued_writer_writes_directly_when_not_started():
+    stream = io.BytesIO()
+    writer = QueuedWriter(stream)
+
+    writer.write(b"early\n")
+
+    assert stream.getvalue() == b"early\n"
+
+
+def test_queued_writer_keeps_writes_racing_stop():
+    stream = io.BytesIO()
+    writer = QueuedWriter(stream)
+    writer.start()
+
+    def write_lines():
+        for i in range(2000):
+            writer.write(b"line %d\n" % i)
+
+    thread = threading.Thread(target=write_lines)
+    thread.start()
+    writer.stop()
+    thread.join()
+
+    assert stream.getvalue().splitlines() == [b"line %d" % i for i in range(2000)]
+
+
+@pytest.fixture
+def restore_logging():
+    """Undo setup_logging: root handlers and level, and the structlog config."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    config = structlog.get_config()
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    structlog.configure(**config)
+
+
+def test_setup_logging_twice_keeps_one_writer(restore_logging):
+    setup_logging()
+    setup_logging()
+
+    writers = [t for t in threading.enumerate() if t.name == "log-writer"]
+    queue_handlers = [
+        h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)
+    ]
+    assert len(writers) == 1
+    assert len(queue_handlers) == 1
+
+
+def test_stdlib_records_after_shutdown_are_written(restore_logging, capsys):
+    setup_logging()
+    shutdown_logging()
+
+    logging.getLogger("after.shutdown").warning("still written")
+
+    assert "still written" in capsys.readouterr().err
+
+
+class FlakyStream(io.BytesIO):
+    """Stream whose second write fails, like a transient EAGAIN on stdout"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        if self.writes == 2:
+            raise BlockingIOError("transient")
+        return super().write(data)
+
+
+def test_queued_writer_survives_a_failed_write(capsys):
+    stream = FlakyStream()
+    writer = QueuedWriter(stream)
+    writer.start()
+
+    for i in range(5):
+        writer.write(b"l%d\n" % i)
+    writer.stop()
+
+    # Only the failed line is lost; the error is reported once
+    assert stream.getvalue().splitlines() == [b"l0", b"l2", b"l3", b"l4"]
+    assert capsys.readouterr().err.count("Logging error") == 1
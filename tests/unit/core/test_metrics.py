@@ -0,0 +1,28 @@
+from prometheus_client import CollectorRegistry, Counter
+
+from core.metrics import LabelCache
+
+
+def make_counter() -> Counter:
+    return Counter(
+        "test_total", "Test", ["method", "path"], registry=CollectorRegistry()
+    )
+
+
+def test_label_cache_reuses_bound_child():
+    counter = make_counter()
+    cache = LabelCache(counter)
+    assert cache.get("GET", "/a") is cache.get("GET", "/a")
+    cache.get("GET", "/a").inc()
+    assert counter.labels("GET", "/a")._value.get() == 1
+
+
+def test_label_cache_evicts_oldest_past_maxsize():
+    cache = LabelCache(make_counter(), maxsize=2)
+    first = cache.get("GET", "/a")
+    cache.get("GET", "/b")
+    cache.get("GET", "/c")
+    assert len(cache._children) == 2
+    assert ("GET", "/a") not in cache._children
+    # Evicted children are rebound, and prometheus hands back the same child
+    assert cache.get("GET", "/a") is first
@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core import readiness
+from core.exceptions import ReadinessError
+
+
+@pytest.fixture(autouse=True)
+def reset_readiness_cache(monkeypatch):
+    monkeypatch.setattr(readiness, "_checked_at", float("-inf"))
+    monkeypatch.setattr(readiness, "_ready", False)
+
+
+async def test_cached_readiness_shares_result_within_ttl():
+    with patch.object(readiness, "check_db_readiness", AsyncMock()) as check:
+        await readiness.cached_db_readiness(ttl=60)
+        await readiness.cached_db_readiness(ttl=60)
+
+    check.assert_awaited_once()
+
+
+async def test_cached_readiness_caches_failures():
+    failing = AsyncMock(side_effect=ReadinessError("DB not ready"))
+    with patch.object(readiness, "check_db_readiness", failing):
+        for _ in range(2):
+            with pytest.raises(ReadinessError):
+                await readiness.cached_db_readiness(ttl=60)
+
+    failing.assert_awaited_once()
+
+
+async def test_cached_readiness_rechecks_after_ttl():
+    with patch.object(readiness, "check_db_readiness", AsyncMock()) as check:
+        await readiness.cached_db_readiness(ttl=0)
+        await readiness.cached_db_readiness(ttl=0)
+
+    assert check.await_count == 2
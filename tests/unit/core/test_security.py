@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from auth.models.enums import UserRole
+from auth.models.schemas import UserOut
+from core.db.ids import uuid7
+from core.security import has_min_role
+
+
+def _user(role: UserRole) -> UserOut:
+    now = datetime.now(timezone.utc)
+    return UserOut(
+        email="user@example.com", id=uuid7(), role=role, created_at=now, updated_at=now
+    )
+
+
+async def test_has_min_role_allows_higher_role():
+    user = _user(UserRole.ADMIN)
+    assert await has_min_role(UserRole.MEMBER)(user) is user
+
+
+async def test_has_min_role_rejects_lower_role():
+    with pytest.raises(HTTPException) as exc_info:
+        await has_min_role(UserRole.ADMIN)(_user(UserRole.VIEWER))
+    assert exc_info.value.status_code == 403
@@ -0,0 +1,16 @@
+from core.settings import Settings
+
+
+def test_derived_configs_are_built_once():
+    settings = Settings(jwt_secret_key="k" * 32, db_url_override="sqlite:///x.db")
+    assert settings.get_jwt_config() is settings.get_jwt_config()
+    assert settings.get_database_config() is settings.get_database_config()
+
+
+def test_database_config_takes_insertmanyvalues_page_size():
+    settings = Settings(
+        jwt_secret_key="k" * 32,
+        db_url_override="sqlite:///x.db",
+        db_insertmanyvalues_page_size=250,
+    )
+    assert settings.get_database_config().insertmanyvalues_page_size == 250
@@ -4,17 +4,37 @@ These factories provide a convenient way to generate test data
 for models and DTOs with sensible defaults and customizable attributes.
 """
 
+import itertools
+import os
 import uuid
 from datetime import datetime, timedelta, timezone
 
 import factory
-from faker import Faker
 
 from auth.models.db import Token, User
 from auth.models.domain import CreateTokenDTO, CreateUserDTO, TokenDTO, UserDTO
 from auth.models.enums import UserRole
 
-fake = Faker()
+# Deterministic sequences instead of Faker providers: unique per build,
+# with no RNG calls or provider data to load.
+EMAIL = factory.Sequence(lambda n: f"user{n}@example.com")
+IPV4 = factory.Sequence(lambda n: f"10.0.{n >> 8 & 255}.{n & 255}")
+
+# UUIDs are drawn from a pool filled with one urandom read at import, not one
+# syscall per uuid4() call. Ids repeat after _UUID_POOL_SIZE builds; a test that
+# needs more distinct ids than that must pass its own.
+_UUID_POOL_SIZE = 1024
+_random = os.urandom(16 * _UUID_POOL_SIZE)
+_UUIDS = itertools.cycle(
+    [
+        uuid.UUID(bytes=_random[i : i + 16], version=4)
+        for i in range(0, len(_random), 16)
+    ]
+)
+UUID = factory.LazyFunction(lambda: next(_UUIDS))
+
+# Bcrypt-shaped (60 chars); no test reads the value, so no need to generate one
+FAKE_PASSWORD_HASH = "$2b$12$" + "a" * 53
 
 
 # ============================================================================
@@ -28,8 +48,8 @@ class CreateUserDTOFactory(factory.Factory):
     class Meta:
         model = CreateUserDTO
 
-    email = factory.Faker("email")
-    hashed_password = factory.LazyFunction(lambda: fake.password(length=60))
+    email = EMAIL
+    hashed_password = FAKE_PASSWORD_HASH
     is_active = True
     role = UserRole.MEMBER
 
@@ -45,13 +65,13 @@ class UserDTOFactory(factory.Factory):
     class Meta:
         model = UserDTO
 
-    id = factory.LazyFunction(uuid.uuid4)
-    email = factory.Faker("email")
-    hashed_password = factory.LazyFunction(lambda: fake.password(length=60))
+    id = UUID
+    email = EMAIL
+    hashed_password = FAKE_PASSWORD_HASH
     is_active = True
     role = UserRole.MEMBER
     created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    updated_at = factory.SelfAttribute("created_at")
 
     @classmethod
     def create_admin(cls, **kwargs):
@@ -64,18 +84,38 @@ class UserDTOFactory(factory.Factory):
         return cls(role=UserRole.OWNER, **kwargs)
 
 
+def make_user_dto(**overrides) -> UserDTO:
+    """Build a UserDTO directly, without factory_boy's declaration walk.
+
+    For tests that only need some valid user; use UserDTOFactory when the
+    fields should vary between builds.
+    """
+    now = datetime.now(timezone.utc)
+    fields = {
+        "id": next(_UUIDS),
+        "email": "user@example.com",
+        "hashed_password": FAKE_PASSWORD_HASH,
+        "is_active": True,
+        "role": UserRole.MEMBER,
+        "created_at": now,
+        "updated_at": now,
+    }
+    fields.update(overrides)
+    return UserDTO(**fields)
+
+
 class CreateTokenDTOFactory(factory.Factory):
     """Factory for creating CreateTokenDTO instances for testing."""
 
     class Meta:
         model = CreateTokenDTO
 
-    user_id = factory.LazyFunction(uuid.uuid4)
+    user_id = UUID
     expires_at = factory.LazyFunction(
         lambda: datetime.now(timezone.utc) + timedelta(hours=1)
     )
     is_active = True
-    ip_address = factory.Faker("ipv4")
+    ip_address = IPV4
 
 
 class TokenDTOFactory(factory.Factory):
@@ -84,15 +124,13 @@ class TokenDTOFactory(factory.Factory):
     class Meta:
         model = TokenDTO
 
-    id = factory.LazyFunction(uuid.uuid4)
-    user_id = factory.LazyFunction(uuid.uuid4)
-    expires_at = factory.LazyFunction(
-        lambda: datetime.now(timezone.utc) + timedelta(hours=1)
-    )
+    id = UUID
+    user_id = UUID
+    expires_at = factory.LazyAttribute(lambda o: o.created_at + timedelta(hours=1))
     is_active = True
-    ip_address = factory.Faker("ipv4")
+    ip_address = IPV4
     created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    updated_at = factory.SelfAttribute("created_at")
 
     @classmethod
     def create_expired(cls, **kwargs):
@@ -116,13 +154,13 @@ class UserDBFactory(factory.Factory):
     class Meta:
         model = User
 
-    id = factory.LazyFunction(uuid.uuid4)
-    email = factory.Faker("email")
-    hashed_password = factory.LazyFunction(lambda: fake.password(length=60))
+    id = UUID
+    email = EMAIL
+    hashed_password = FAKE_PASSWORD_HASH
     is_active = True
     role = UserRole.MEMBER
     created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    updated_at = factory.SelfAttribute("created_at")
 
     @classmethod
     def create_admin(cls, **kwargs):
@@ -136,16 +174,10 @@ class TokenDBFactory(factory.Factory):
     class Meta:
         model = Token
 
-    id = factory.LazyFunction(uuid.uuid4)
-    user_id = factory.LazyFunction(uuid.uuid4)
-    expires_at = factory.LazyFunction(
-        lambda: datetime.now(timezone.utc) + timedelta(hours=1)
-    )
+    id = UUID
+    user_id = UUID
+    expires_at = factory.LazyAttribute(lambda o: o.created_at + timedelta(hours=1))
     is_active = True
-    ip_address = factory.Faker("ipv4")
+    ip_address = IPV4
     created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    user_id = factory.LazyFunction(lambda: uuid.uuid4())
-    expires_at = factory.LazyFunction(lambda: fake.future_datetime(end_date="+30d"))
-    is_active = True
-    ip_address = factory.Faker("ipv4")
+    updated_at = factory.SelfAttribute("created_at")